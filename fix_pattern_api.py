@@ -13,62 +13,50 @@ Usage:
   python fix_pattern_api.py
 """
 
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
 
+# spacing followed by direction X/Y/Z, rewritten in a single pass
+_PATTERN = re.compile(
+    r"(\s+)spacing:\s*([^\n]+)\n\s+direction:\s*([XYZ])",
+    re.MULTILINE
+)
+_PATTERN_BYTES = re.compile(_PATTERN.pattern.encode(), re.MULTILINE)
+
 
 def fix_pattern_in_file(filepath):
     """Fix pattern API in a single YAML file."""
-    with open(filepath, 'r') as f:
-        content = f.read()
 
-    original_content = content
+    # Scan the mapped bytes first; most files need no rewrite
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False, []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Plain substring test rules out most files before the regex runs
+            if mm.find(b'direction:') == -1 or not _PATTERN_BYTES.search(mm):
+                return False, []
+            content = mm[:].decode('utf-8')
+
     changes = []
 
-    # Pattern 1: spacing with direction X
-    pattern_x = re.compile(
-        r"(\s+)spacing:\s*([^\n]+)\n\s+direction:\s*X",
-        re.MULTILINE
-    )
-    matches = list(pattern_x.finditer(content))
-    for match in reversed(matches):  # Process in reverse to maintain positions
-        indent = match.group(1)
-        spacing_value = match.group(2)
-        old_text = match.group(0)
-        new_text = f"{indent}spacing: [{spacing_value}, 0, 0]"
-        content = content[:match.start()] + new_text + content[match.end():]
-        changes.append(f"  X-direction: {spacing_value} → [{spacing_value}, 0, 0]")
-
-    # Pattern 2: spacing with direction Y
-    pattern_y = re.compile(
-        r"(\s+)spacing:\s*([^\n]+)\n\s+direction:\s*Y",
-        re.MULTILINE
-    )
-    matches = list(pattern_y.finditer(content))
-    for match in reversed(matches):
+    def replace(match):
         indent = match.group(1)
         spacing_value = match.group(2)
-        old_text = match.group(0)
-        new_text = f"{indent}spacing: [0, {spacing_value}, 0]"
-        content = content[:match.start()] + new_text + content[match.end():]
-        changes.append(f"  Y-direction: {spacing_value} → [0, {spacing_value}, 0]")
-
-    # Pattern 3: spacing with direction Z
-    pattern_z = re.compile(
-        r"(\s+)spacing:\s*([^\n]+)\n\s+direction:\s*Z",
-        re.MULTILINE
-    )
-    matches = list(pattern_z.finditer(content))
-    for match in reversed(matches):
-        indent = match.group(1)
-        spacing_value = match.group(2)
-        old_text = match.group(0)
-        new_text = f"{indent}spacing: [0, 0, {spacing_value}]"
-        content = content[:match.start()] + new_text + content[match.end():]
-        changes.append(f"  Z-direction: {spacing_value} → [0, 0, {spacing_value}]")
-
-    if content != original_content:
+        axis = match.group(3)
+        vector = {
+            'X': f"[{spacing_value}, 0, 0]",
+            'Y': f"[0, {spacing_value}, 0]",
+            'Z': f"[0, 0, {spacing_value}]",
+        }[axis]
+        changes.append(f"  {axis}-direction: {spacing_value} → {vector}")
+        return f"{indent}spacing: {vector}"
+
+    content, count = _PATTERN.subn(replace, content)
+
+    if count:
         with open(filepath, 'w') as f:
             f.write(content)
         return True, changes
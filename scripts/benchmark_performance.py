@@ -4,14 +4,84 @@ TiaCAD v3.0 Performance Benchmark
 
 Measures parsing and build times for various example files to ensure
 no performance regression from v3.0 unified spatial reference system.
+
+Usage:
+    python scripts/benchmark_performance.py
+    python scripts/benchmark_performance.py --output bench.json
+    python scripts/benchmark_performance.py --baseline bench.json
 """
 
+import argparse
+import copy
+import heapq
+import json
+import os
+import subprocess
+import sys
 import time
 import yaml
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from tiacad_core.parser.tiacad_parser import TiaCADParser
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+    print("⚠️  PyYAML is not linked against libyaml; falling back to the "
+          "pure-Python loader (slow)")
+
+
+# Parsed YAML keyed by path -> (mtime, size, content); LRU-evicted
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+def _load_yaml_cached(filepath: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Returns a deep copy so callers may mutate the result freely.
+    """
+    key = str(filepath)
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
+        # One read of the whole file, bypassing the buffered io layer
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, st.st_size, os.POSIX_FADV_SEQUENTIAL)
+        data = os.read(fd, st.st_size)
+    finally:
+        os.close(fd)
+
+    content = yaml.load(data, Loader=_YamlLoader)
+
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, content)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(content)
+
+
+_PARSER: Optional[TiaCADParser] = None
+
+
+def _get_parser() -> TiaCADParser:
+    """Return the process-wide parser (TiaCADParser holds no per-file state)."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = TiaCADParser()
+    return _PARSER
+
 
 def benchmark_file(filepath: Path, iterations: int = 3) -> Dict[str, float]:
     """
@@ -24,29 +94,28 @@ def benchmark_file(filepath: Path, iterations: int = 3) -> Dict[str, float]:
     Returns:
         Dict with timing results (in milliseconds)
     """
-    parser = TiaCADParser()
+    parser = _get_parser()
 
     # Load YAML once
-    with open(filepath) as f:
-        yaml_content = yaml.safe_load(f)
+    yaml_content = _load_yaml_cached(filepath)
 
-    load_times = []
     parse_times = []
     total_times = []
 
     for _ in range(iterations):
+        # Fresh input each iteration so a mutating parse can't skew later runs
+        iteration_content = copy.deepcopy(yaml_content)
+
         # Measure total time
-        start_total = time.perf_counter()
+        start_total = time.perf_counter_ns()
 
         # Measure parse time
-        start_parse = time.perf_counter()
+        start_parse = time.perf_counter_ns()
         try:
-            result = parser.parse_dict(yaml_content)
-            parse_time = (time.perf_counter() - start_parse) * 1000
-            parse_times.append(parse_time)
-
-            total_time = (time.perf_counter() - start_total) * 1000
-            total_times.append(total_time)
+            parser.parse_dict(iteration_content)
+            end = time.perf_counter_ns()
+            parse_times.append((end - start_parse) / 1e6)
+            total_times.append((end - start_total) / 1e6)
         except Exception as e:
             print(f"  Error parsing {filepath.name}: {e}")
             return None
@@ -61,12 +130,17 @@ def benchmark_file(filepath: Path, iterations: int = 3) -> Dict[str, float]:
     }
 
 
-def run_benchmarks(examples_dir: Path = Path("examples")) -> List[Tuple[str, Dict]]:
+def run_benchmarks(examples_dir: Path = Path("examples"),
+                   workers: Optional[int] = None) -> List[Tuple[str, Dict]]:
     """
     Run benchmarks on all example files.
 
+    Files are benchmarked in parallel worker processes; each worker builds
+    its own parser, so no parser state is shared between files.
+
     Args:
         examples_dir: Directory containing example YAML files
+        workers: Number of worker processes (default: CPU count)
 
     Returns:
         List of (filename, results) tuples
@@ -105,23 +179,40 @@ def run_benchmarks(examples_dir: Path = Path("examples")) -> List[Tuple[str, Dic
         ],
     }
 
+    # One directory read instead of an exists() call per file
+    available = set()
+    if examples_dir.is_dir():
+        with os.scandir(examples_dir) as it:
+            available = {entry.name for entry in it if entry.is_file()}
+
     print("=" * 80)
     print("TiaCAD v3.0 Performance Benchmark")
     print("=" * 80)
     print()
 
+    pending = [
+        filename
+        for files in categories.values()
+        for filename in files
+        if filename in available
+    ]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        file_results = dict(zip(
+            pending,
+            executor.map(benchmark_file, [examples_dir / f for f in pending])
+        ))
+
     for category, files in categories.items():
         print(f"\n{category}")
         print("-" * 80)
 
         for filename in files:
-            filepath = examples_dir / filename
-            if not filepath.exists():
+            if filename not in available:
                 print(f"  ⚠️  {filename:40s} [MISSING]")
                 continue
 
-            print(f"  {filename:40s} ", end="", flush=True)
-            result = benchmark_file(filepath, iterations=3)
+            print(f"  {filename:40s} ", end="")
+            result = file_results[filename]
 
             if result:
                 results.append((filename, result))
@@ -142,35 +233,118 @@ def print_summary(results: List[Tuple[str, Dict]]):
     print("Summary Statistics")
     print("=" * 80)
 
-    parse_times = [r['parse_avg'] for _, r in results]
-    total_times = [r['total_avg'] for _, r in results]
-
-    print(f"\nTotal files benchmarked: {len(results)}")
+    # Accumulate all statistics in one pass over the results
+    count = len(results)
+    parse_sum = total_sum = 0.0
+    parse_min = total_min = float("inf")
+    parse_max = total_max = float("-inf")
+    for _, r in results:
+        parse_avg = r['parse_avg']
+        total_avg = r['total_avg']
+        parse_sum += parse_avg
+        total_sum += total_avg
+        parse_min = min(parse_min, parse_avg)
+        parse_max = max(parse_max, parse_avg)
+        total_min = min(total_min, total_avg)
+        total_max = max(total_max, total_avg)
+
+    print(f"\nTotal files benchmarked: {count}")
     print(f"\nParse times:")
-    print(f"  Average: {sum(parse_times) / len(parse_times):.2f}ms")
-    print(f"  Min:     {min(parse_times):.2f}ms")
-    print(f"  Max:     {max(parse_times):.2f}ms")
+    print(f"  Average: {parse_sum / count:.2f}ms")
+    print(f"  Min:     {parse_min:.2f}ms")
+    print(f"  Max:     {parse_max:.2f}ms")
 
     print(f"\nTotal times:")
-    print(f"  Average: {sum(total_times) / len(total_times):.2f}ms")
-    print(f"  Min:     {min(total_times):.2f}ms")
-    print(f"  Max:     {max(total_times):.2f}ms")
+    print(f"  Average: {total_sum / count:.2f}ms")
+    print(f"  Min:     {total_min:.2f}ms")
+    print(f"  Max:     {total_max:.2f}ms")
 
     # Find slowest files
     print(f"\nSlowest 5 files (parse time):")
-    sorted_results = sorted(results, key=lambda x: x[1]['parse_avg'], reverse=True)
-    for filename, result in sorted_results[:5]:
+    for filename, result in heapq.nlargest(5, results, key=lambda x: x[1]['parse_avg']):
         print(f"  {filename:40s} {result['parse_avg']:6.2f}ms")
 
     print()
 
 
+def write_json(results: List[Tuple[str, Dict]], output_path: Path):
+    """
+    Write benchmark results as JSON for regression tracking.
+
+    Args:
+        results: List of (filename, results) tuples
+        output_path: Destination JSON file
+    """
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+        ).strip().decode()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    data = {
+        "python": sys.version,
+        "commit": commit,
+        "results": [{"file": filename, **result} for filename, result in results],
+    }
+    with open(output_path, "w") as f:
+        json.dump(data, f, indent=2)
+
+    print(f"Results written to {output_path}")
+
+
+def print_baseline_comparison(results: List[Tuple[str, Dict]], baseline_path: Path):
+    """
+    Print per-file parse time deltas against a previous JSON run.
+
+    Args:
+        results: List of (filename, results) tuples
+        baseline_path: JSON file written by a previous --output run
+    """
+    with open(baseline_path) as f:
+        baseline = {r["file"]: r for r in json.load(f)["results"]}
+
+    print("\n" + "=" * 80)
+    print(f"Comparison with baseline: {baseline_path}")
+    print("=" * 80)
+
+    for filename, result in results:
+        previous = baseline.get(filename)
+        if previous is None:
+            print(f"  {filename:40s} [NEW]")
+            continue
+        delta = result["parse_avg"] - previous["parse_avg"]
+        percent = delta / previous["parse_avg"] * 100 if previous["parse_avg"] else 0.0
+        print(f"  {filename:40s} {previous['parse_avg']:8.2f}ms → "
+              f"{result['parse_avg']:8.2f}ms  ({percent:+6.1f}%)")
+
+    print()
+
+
 def main():
     """Run performance benchmarks."""
+    arg_parser = argparse.ArgumentParser(description="TiaCAD performance benchmark")
+    arg_parser.add_argument(
+        "--output", "-o",
+        type=Path,
+        help="Write machine-readable results to this JSON file"
+    )
+    arg_parser.add_argument(
+        "--baseline", "-b",
+        type=Path,
+        help="Compare against a JSON file from a previous --output run"
+    )
+    args = arg_parser.parse_args()
+
     try:
         results = run_benchmarks()
         print_summary(results)
 
+        if args.baseline:
+            print_baseline_comparison(results, args.baseline)
+        if args.output:
+            write_json(results, args.output)
+
         print("=" * 80)
         print("✓ Performance benchmark complete")
         print("=" * 80)
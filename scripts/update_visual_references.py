@@ -22,7 +22,6 @@ import argparse
 import os
 import sys
 from pathlib import Path
-import subprocess
 
 
 def main():
@@ -68,8 +67,7 @@ def main():
         return 0
 
     # Update references
-    update_references(args.test, project_root)
-    return 0
+    return update_references(args.test, project_root)
 
 
 def list_references(ref_dir: Path):
@@ -78,7 +76,12 @@ def list_references(ref_dir: Path):
         print(f"No reference directory found at {ref_dir}")
         return
 
-    refs = sorted(ref_dir.glob("*.png"))
+    # DirEntry caches stat info from the directory read
+    with os.scandir(ref_dir) as it:
+        refs = sorted(
+            (entry for entry in it if entry.name.endswith(".png")),
+            key=lambda entry: entry.name
+        )
 
     if not refs:
         print("No reference images found")
@@ -123,15 +126,11 @@ def update_references(test_name: str, project_root: Path):
     # Change to project root
     os.chdir(project_root)
 
-    # Build pytest command
-    cmd = ["pytest", "-m", "visual", "-v"]
+    # Build pytest arguments
+    pytest_args = ["-m", "visual", "-v"]
 
     if test_name:
-        cmd.extend(["-k", test_name])
-
-    # Set environment variable
-    env = os.environ.copy()
-    env["UPDATE_VISUAL_REFERENCES"] = "1"
+        pytest_args.extend(["-k", test_name])
 
     print("=" * 60)
     print("Updating Visual Reference Images")
@@ -142,16 +141,26 @@ def update_references(test_name: str, project_root: Path):
     else:
         print("Updating: All visual tests")
 
-    print(f"Command: {' '.join(cmd)}")
+    print(f"Command: pytest {' '.join(pytest_args)}")
     print()
 
-    # Run pytest
-    result = subprocess.run(cmd, env=env)
+    # Run pytest in-process with UPDATE_VISUAL_REFERENCES=1
+    import pytest
+
+    previous = os.environ.get("UPDATE_VISUAL_REFERENCES")
+    os.environ["UPDATE_VISUAL_REFERENCES"] = "1"
+    try:
+        returncode = int(pytest.main(pytest_args))
+    finally:
+        if previous is None:
+            del os.environ["UPDATE_VISUAL_REFERENCES"]
+        else:
+            os.environ["UPDATE_VISUAL_REFERENCES"] = previous
 
     print()
     print("=" * 60)
 
-    if result.returncode == 0:
+    if returncode == 0:
         print("✓ Reference images updated successfully")
         print()
         print("Next steps:")
@@ -160,8 +169,8 @@ def update_references(test_name: str, project_root: Path):
         print("  3. Commit the changes to git")
     else:
         print("✗ Failed to update reference images")
-        print(f"Exit code: {result.returncode}")
-        return result.returncode
+        print(f"Exit code: {returncode}")
+        return returncode
 
     return 0
 
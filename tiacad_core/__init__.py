@@ -13,20 +13,56 @@ Status: Production - Visual Regression Testing Complete
 
 __version__ = "3.1.2"
 
-from .part import Part, PartRegistry
-from .selector_resolver import SelectorResolver
-from .transform_tracker import TransformTracker
-from .spatial_resolver import SpatialResolver
-from .utils import (
-    get_center,
-    get_bounding_box,
-    TiaCADError,
-    GeometryError,
-    InvalidGeometryError,
-    TransformError,
-    SelectorError,
-    PointResolutionError,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names resolved on first access (PEP 562), so importing the package
+# (or any submodule) does not pull in CadQuery/OCCT until geometry is needed.
+_LAZY_IMPORTS = {
+    'Part': '.part',
+    'PartRegistry': '.part',
+    'SelectorResolver': '.selector_resolver',
+    'TransformTracker': '.transform_tracker',
+    'SpatialResolver': '.spatial_resolver',
+    'get_center': '.utils',
+    'get_bounding_box': '.utils',
+    'TiaCADError': '.utils',
+    'GeometryError': '.utils',
+    'InvalidGeometryError': '.utils',
+    'TransformError': '.utils',
+    'SelectorError': '.utils',
+    'PointResolutionError': '.utils',
+}
+
+if TYPE_CHECKING:
+    from .part import Part, PartRegistry
+    from .selector_resolver import SelectorResolver
+    from .transform_tracker import TransformTracker
+    from .spatial_resolver import SpatialResolver
+    from .utils import (
+        get_center,
+        get_bounding_box,
+        TiaCADError,
+        GeometryError,
+        InvalidGeometryError,
+        TransformError,
+        SelectorError,
+        PointResolutionError,
+    )
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Core components
@@ -13,10 +13,15 @@ Version: 3.1.1
 """
 
 import argparse
+import io
+import os
 import sys
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
 import time
 
+VERSION_STRING = 'TiaCAD 3.1.1'
+
 # Color codes for terminal output
 class Colors:
     """ANSI color codes for terminal output"""
@@ -69,14 +74,37 @@ def print_header(message: str):
     print(f"{Colors.BOLD}{message}{Colors.RESET}")
 
 
+@contextmanager
+def buffered_output():
+    """Collect stdout printed inside the block and emit it in a single write"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 class ProgressBar:
     """Simple progress bar for long operations"""
 
+    WIDTH = 50
+    MIN_INTERVAL = 1 / 30  # Redraw at most ~30 times per second
+
+    # Pre-encoded bar segments (3 UTF-8 bytes per block character);
+    # each frame slices these instead of building and encoding a new string
+    _FULL = ('█' * WIDTH).encode('utf-8')
+    _EMPTY = ('░' * WIDTH).encode('utf-8')
+    _CHAR_BYTES = 3
+
     def __init__(self, total: int, description: str = "Processing"):
         self.total = total
         self.current = 0
         self.description = description
         self.start_time = time.time()
+        self._last_render = 0.0
+        self._description_bytes = description.encode('utf-8')
 
     def update(self, n: int = 1):
         """Update progress by n steps"""
@@ -88,21 +116,102 @@ class ProgressBar:
         if not sys.stdout.isatty():
             return  # Don't show progress bar in non-TTY
 
+        now = time.time()
+        done = self.current >= self.total
+        if not done and now - self._last_render < self.MIN_INTERVAL:
+            return
+        self._last_render = now
+
         percent = (self.current / self.total) * 100
-        filled = int(50 * self.current / self.total)
-        bar = '█' * filled + '░' * (50 - filled)
-        elapsed = time.time() - self.start_time
+        filled = min(int(self.WIDTH * self.current / self.total), self.WIDTH)
+        bar = (self._FULL[:filled * self._CHAR_BYTES]
+               + self._EMPTY[:(self.WIDTH - filled) * self._CHAR_BYTES])
+        elapsed = now - self.start_time
+
+        line = b'\r%s: |%s| %.1f%% (%.1fs)' % (self._description_bytes, bar, percent, elapsed)
+        if done:
+            line += b'\n'  # New line when done
+
+        sys.stdout.flush()  # Keep ordering with print()-based output
+        sys.stdout.buffer.write(line)
+        sys.stdout.buffer.flush()
+
 
-        print(f'\r{self.description}: |{bar}| {percent:.1f}% ({elapsed:.1f}s)', end='', flush=True)
+_PARSER_CLASS = None
 
-        if self.current >= self.total:
-            print()  # New line when done
+
+def _get_parser_class():
+    """Import TiaCADParser on first use and keep it for later commands"""
+    global _PARSER_CLASS
+    if _PARSER_CLASS is None:
+        from .parser.tiacad_parser import TiaCADParser
+        _PARSER_CLASS = TiaCADParser
+    return _PARSER_CLASS
+
+
+def _file_digest(input_file: Path) -> str:
+    """SHA1 of a file's contents (keys the parse and mesh caches)"""
+    import hashlib
+    return hashlib.sha1(input_file.read_bytes()).hexdigest()
+
+
+# Parsed documents kept in the parse cache; older entries are pruned
+_PARSE_CACHE_MAX_FILES = 64
+
+
+def _parse_cached(input_file: Path, validate_schema: bool = False, use_cache: bool = True):
+    """
+    Parse a TiaCAD file, reusing a pickled document when the YAML is unchanged.
+
+    The cache key covers the TiaCAD version, a fingerprint of the
+    tiacad_core sources, the schema-validation mode and the SHA1 of the
+    file contents. Only the _PARSE_CACHE_MAX_FILES most recently used
+    documents are kept. Cache read/write failures fall back to a normal
+    parse.
+    """
+    import pickle
+    from . import __version__
+    from .utils.cache import cache_root, code_fingerprint, prune_cache
+
+    TiaCADParser = _get_parser_class()
+
+    if not use_cache:
+        return TiaCADParser.parse_file(str(input_file), validate_schema=validate_schema)
+
+    digest = _file_digest(input_file)
+    mode = 'strict' if validate_schema else 'lax'
+    cache_dir = cache_root() / 'parse'
+    cache_file = cache_dir / f"{__version__}-{code_fingerprint()}-{mode}-{digest}.pkl"
+
+    try:
+        with open(cache_file, 'rb') as f:
+            doc = pickle.load(f)
+        os.utime(cache_file)  # Mark as recently used for pruning
+        return doc
+    except Exception:
+        pass  # Missing or unreadable cache entry - parse normally
+
+    doc = TiaCADParser.parse_file(str(input_file), validate_schema=validate_schema)
+
+    tmp_file = cache_file.with_suffix('.tmp')
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(doc, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+        prune_cache(cache_dir, '*.pkl', _PARSE_CACHE_MAX_FILES)
+    except Exception:
+        # Caching is best-effort (e.g. read-only home, unpicklable geometry)
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    return doc
 
 
 def cmd_build(args):
     """Build a TiaCAD YAML file to 3MF/STL/STEP (defaults to 3MF)"""
-    from .parser.tiacad_parser import TiaCADParser
-
     input_file = Path(args.input)
 
     # Validate input file exists
@@ -129,7 +238,8 @@ def cmd_build(args):
         print_info(f"Building {Colors.CYAN}{input_file}{Colors.RESET}")
         start_time = time.time()
 
-        doc = TiaCADParser.parse_file(str(input_file), validate_schema=args.validate_schema)
+        doc = _parse_cached(input_file, validate_schema=args.validate_schema,
+                            use_cache=not args.no_cache)
 
         parse_time = time.time() - start_time
         print_success(f"Parsed in {parse_time:.2f}s")
@@ -141,7 +251,9 @@ def cmd_build(args):
         if output_ext == '.stl':
             doc.export_stl(str(output_file), part_name=args.part)
         elif output_ext == '.3mf':
-            doc.export_3mf(str(output_file), part_name=args.part)
+            source_digest = None if args.no_cache else _file_digest(input_file)
+            doc.export_3mf(str(output_file), part_name=args.part,
+                           source_digest=source_digest)
         elif output_ext == '.step':
             doc.export_step(str(output_file), part_name=args.part)
 
@@ -177,19 +289,53 @@ def cmd_build(args):
         return 1
 
 
+def _validate_one(file_path: str):
+    """Validate a single file (runs in a worker process for cmd_validate)"""
+    try:
+        return _get_parser_class().validate_file(file_path)
+    except Exception as e:
+        return (False, [str(e)])
+
+
+def _expand_glob(pattern: str):
+    """
+    Expand a glob pattern, walking only from its wildcard-free prefix.
+
+    'examples/*.yaml' scans examples/ rather than the whole working tree,
+    and absolute patterns work as well as relative ones.
+    """
+    parts = Path(pattern).parts
+    fixed = 0
+    while fixed < len(parts) and not any(c in parts[fixed] for c in '*?['):
+        fixed += 1
+
+    root = Path(*parts[:fixed]) if fixed else Path('.')
+    if fixed == len(parts):
+        return [root] if root.is_file() else []
+    return list(root.glob(str(Path(*parts[fixed:]))))
+
+
 def cmd_validate(args):
     """Validate TiaCAD YAML files without building geometry"""
-    from .parser.tiacad_parser import TiaCADParser
-
-    # Expand glob patterns
+    # Expand glob patterns, validating each file once even if several
+    # patterns match it
     files = []
+    seen = set()
+
+    def add(path):
+        resolved = path.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            files.append(path)
+
     for pattern in args.files:
         path = Path(pattern)
         if path.is_file():
-            files.append(path)
+            add(path)
         elif '*' in pattern or '?' in pattern:
             # Glob pattern
-            files.extend(Path('.').glob(pattern))
+            for match in _expand_glob(pattern):
+                add(match)
         else:
             print_warning(f"No files found matching: {pattern}")
 
@@ -202,22 +348,24 @@ def cmd_validate(args):
     valid_count = 0
     invalid_count = 0
 
-    for file in files:
-        try:
-            is_valid, errors = TiaCADParser.validate_file(str(file))
-
-            if is_valid:
-                print_success(f"{file}")
-                valid_count += 1
-            else:
-                print_error(f"{file}")
-                for error in errors:
-                    print(f"  {Colors.RED}└─{Colors.RESET} {error}")
-                invalid_count += 1
-
-        except Exception as e:
+    # Validate in worker processes; small batches aren't worth the pool startup
+    paths = [str(file) for file in files]
+    if len(paths) < 4:
+        results = [_validate_one(path) for path in paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(_validate_one, paths))
+
+    # Report in the order the files were given
+    for file, (is_valid, errors) in zip(files, results):
+        if is_valid:
+            print_success(f"{file}")
+            valid_count += 1
+        else:
             print_error(f"{file}")
-            print(f"  {Colors.RED}└─{Colors.RESET} {str(e)}")
+            for error in errors:
+                print(f"  {Colors.RED}└─{Colors.RESET} {error}")
             invalid_count += 1
 
     # Summary
@@ -234,8 +382,6 @@ def cmd_validate(args):
 
 def cmd_info(args):
     """Show information about a TiaCAD file"""
-    from .parser.tiacad_parser import TiaCADParser
-
     input_file = Path(args.input)
 
     if not input_file.exists():
@@ -243,48 +389,49 @@ def cmd_info(args):
         return 1
 
     try:
-        doc = TiaCADParser.parse_file(str(input_file))
-
-        # Header
-        print_header(f"\n📄 {input_file.name}")
-        print()
+        doc = _parse_cached(input_file, validate_schema=args.strict, use_cache=not args.no_cache)
 
-        # Metadata
-        if doc.metadata:
-            print_header("Metadata:")
-            for key, value in doc.metadata.items():
-                print(f"  {Colors.CYAN}{key}:{Colors.RESET} {value}")
+        with buffered_output():
+            # Header
+            print_header(f"\n📄 {input_file.name}")
             print()
 
-        # Parameters
-        if doc.parameters:
-            print_header(f"Parameters ({len(doc.parameters)}):")
-            for name, value in doc.parameters.items():
-                print(f"  {Colors.CYAN}{name}:{Colors.RESET} {value}")
-            print()
+            # Metadata
+            if doc.metadata:
+                print_header("Metadata:")
+                for key, value in doc.metadata.items():
+                    print(f"  {Colors.CYAN}{key}:{Colors.RESET} {value}")
+                print()
 
-        # Parts
-        parts = doc.parts.list_parts()
-        print_header(f"Parts ({len(parts)}):")
-        for part_name in parts:
-            part = doc.parts.get(part_name)
-            prim_type = part.metadata.get('primitive_type', 'unknown')
-            print(f"  {Colors.GREEN}•{Colors.RESET} {part_name} ({prim_type})")
-        print()
+            # Parameters
+            if doc.parameters:
+                print_header(f"Parameters ({len(doc.parameters)}):")
+                for name, value in doc.parameters.items():
+                    print(f"  {Colors.CYAN}{name}:{Colors.RESET} {value}")
+                print()
 
-        # Operations
-        if doc.operations:
-            print_header(f"Operations ({len(doc.operations)}):")
-            for op_name, op_def in doc.operations.items():
-                op_type = op_def.get('type', 'unknown')
-                print(f"  {Colors.YELLOW}•{Colors.RESET} {op_name} ({op_type})")
+            # Parts
+            parts = doc.parts.list_parts()
+            print_header(f"Parts ({len(parts)}):")
+            for part_name in parts:
+                part = doc.parts.get(part_name)
+                prim_type = part.metadata.get('primitive_type', 'unknown')
+                print(f"  {Colors.GREEN}•{Colors.RESET} {part_name} ({prim_type})")
             print()
 
-        # Quick stats
-        print_header("Statistics:")
-        print(f"  Total parts: {len(parts)}")
-        print(f"  Parameters: {len(doc.parameters)}")
-        print(f"  Operations: {len(doc.operations)}")
+            # Operations
+            if doc.operations:
+                print_header(f"Operations ({len(doc.operations)}):")
+                for op_name, op_def in doc.operations.items():
+                    op_type = op_def.get('type', 'unknown')
+                    print(f"  {Colors.YELLOW}•{Colors.RESET} {op_name} ({op_type})")
+                print()
+
+            # Quick stats
+            print_header("Statistics:")
+            print(f"  Total parts: {len(parts)}")
+            print(f"  Parameters: {len(doc.parameters)}")
+            print(f"  Operations: {len(doc.operations)}")
 
         return 0
 
@@ -308,8 +455,13 @@ def cmd_validate_geometry(args):
     - Positive volumes
     - No degenerate faces
     """
-    from .parser.tiacad_parser import TiaCADParser
+    input_file = Path(args.input)
+
+    if not input_file.exists():
+        print_error(f"File not found: {input_file}")
+        return 1
 
+    # Heavy imports only once the input is known to exist
     try:
         import trimesh
     except ImportError:
@@ -317,21 +469,13 @@ def cmd_validate_geometry(args):
         print_info("Install with: pip install trimesh")
         return 1
 
-    import tempfile
-
-    input_file = Path(args.input)
-
-    if not input_file.exists():
-        print_error(f"File not found: {input_file}")
-        return 1
-
     print_info(f"Validating {Colors.CYAN}{input_file.name}{Colors.RESET}")
     print()
 
     try:
         # Parse YAML
         start_time = time.time()
-        doc = TiaCADParser.parse_file(str(input_file))
+        doc = _parse_cached(input_file, validate_schema=args.strict, use_cache=not args.no_cache)
         parse_time = time.time() - start_time
 
         # Determine which part to validate
@@ -351,57 +495,73 @@ def cmd_validate_geometry(args):
         # Get part
         part = doc.parts.get(part_name)
 
-        # Export to temp STL
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-
-        try:
-            export_start = time.time()
-            part.geometry.val().exportStl(str(tmp_path))
-            export_time = time.time() - export_start
-
-            # Load mesh
-            mesh = trimesh.load(str(tmp_path))
-
-            # Compute stats
-            components = mesh.split(only_watertight=False)
-
-            stats = {
-                'vertices': len(mesh.vertices),
-                'faces': len(mesh.faces),
-                'volume': mesh.volume,
-                'watertight': mesh.is_watertight,
-                'components': len(components),
-            }
-
-            # Find issues
-            issues = []
-
-            if stats['components'] > 1:
-                issues.append(
-                    f"❌ {stats['components']} disconnected parts (expected 1 for printable model)"
-                )
-                if args.verbose:
-                    for i, comp in enumerate(components[:5]):
-                        issues.append(
-                            f"   Component {i+1}: {len(comp.vertices)} vertices, {len(comp.faces)} faces"
-                        )
-                    if len(components) > 5:
-                        issues.append(f"   ... and {len(components) - 5} more")
-
-            if not stats['watertight']:
-                issues.append("❌ Mesh not watertight (will cause slicing errors)")
-
-            if stats['volume'] <= 0:
-                issues.append(f"❌ Invalid volume: {stats['volume']:.2f} mm³")
-
-            if stats['vertices'] == 0:
-                issues.append("❌ Empty mesh (no vertices)")
-
-            if stats['faces'] == 0:
-                issues.append("❌ No faces")
-
-            # Display results
+        # Tessellate straight into a trimesh (no STL round-trip), reusing
+        # a mesh cached by an earlier build; processing merges the
+        # per-face duplicate vertices
+        import numpy as np
+        import trimesh.graph
+        from .exporters.mesh_cache import tessellate_cached
+
+        mesh_start = time.time()
+        vertices, triangles = tessellate_cached(
+            part.geometry.val(),
+            part_name,
+            0.1,
+            0.1,
+            source_digest=None if args.no_cache else _file_digest(input_file)
+        )
+        mesh = trimesh.Trimesh(
+            vertices=vertices.astype(np.float64),
+            faces=triangles.astype(np.int64),
+        )
+        mesh_time = time.time() - mesh_start
+
+        # Compute stats - label connected faces without building submeshes
+        components = trimesh.graph.connected_components(
+            mesh.face_adjacency,
+            nodes=np.arange(len(mesh.faces)),
+            min_len=1
+        )
+
+        stats = {
+            'vertices': len(mesh.vertices),
+            'faces': len(mesh.faces),
+            'volume': mesh.volume,
+            'watertight': mesh.is_watertight,
+            'components': len(components),
+        }
+
+        # Find issues
+        issues = []
+
+        if stats['components'] > 1:
+            issues.append(
+                f"❌ {stats['components']} disconnected parts (expected 1 for printable model)"
+            )
+            if args.verbose:
+                # Only materialize the components we actually report
+                submeshes = mesh.submesh(components[:5], append=False)
+                for i, comp in enumerate(submeshes):
+                    issues.append(
+                        f"   Component {i+1}: {len(comp.vertices)} vertices, {len(comp.faces)} faces"
+                    )
+                if len(components) > 5:
+                    issues.append(f"   ... and {len(components) - 5} more")
+
+        if not stats['watertight']:
+            issues.append("❌ Mesh not watertight (will cause slicing errors)")
+
+        if stats['volume'] <= 0:
+            issues.append(f"❌ Invalid volume: {stats['volume']:.2f} mm³")
+
+        if stats['vertices'] == 0:
+            issues.append("❌ Empty mesh (no vertices)")
+
+        if stats['faces'] == 0:
+            issues.append("❌ No faces")
+
+        # Display results
+        with buffered_output():
             print()
             print_header("📊 Geometry Analysis")
             print()
@@ -412,24 +572,21 @@ def cmd_validate_geometry(args):
             print(f"  Components:  {stats['components']}")
             print()
 
-            if len(issues) == 0:
-                print_success("✅ Geometry is valid and printable")
-                print()
-                print_info(f"Parse time:  {parse_time:.2f}s")
-                print_info(f"Export time: {export_time:.2f}s")
-                return 0
-            else:
-                print_error("❌ Geometry validation failed:")
-                print()
-                for issue in issues:
-                    print(f"  {issue}")
-                print()
-                print_warning("💡 Tip: For union operations, ensure parts actually overlap")
-                print()
-                return 1
-
-        finally:
-            tmp_path.unlink(missing_ok=True)
+        if len(issues) == 0:
+            print_success("✅ Geometry is valid and printable")
+            print()
+            print_info(f"Parse time:  {parse_time:.2f}s")
+            print_info(f"Mesh time:   {mesh_time:.2f}s")
+            return 0
+        else:
+            print_error("❌ Geometry validation failed:")
+            print()
+            for issue in issues:
+                print(f"  {issue}")
+            print()
+            print_warning("💡 Tip: For union operations, ensure parts actually overlap")
+            print()
+            return 1
 
     except Exception as e:
         print_error(f"Validation failed: {str(e)}")
@@ -441,69 +598,117 @@ def cmd_validate_geometry(args):
         return 1
 
 
-def create_parser():
-    """Create the argument parser"""
-    parser = argparse.ArgumentParser(
-        prog='tiacad',
-        description='TiaCAD - Declarative Parametric CAD in YAML',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  tiacad build examples/plate.yaml                    # Outputs plate.3mf (modern format)
-  tiacad build examples/plate.yaml -o plate.stl       # Force STL output
-  tiacad build examples/bracket.yaml -o bracket.step  # CAD exchange format
-  tiacad validate examples/*.yaml
-  tiacad info examples/bracket.yaml
-
-Note: 3MF is the recommended format for 3D printing (multi-material, compact, modern).
-      STL is supported for legacy compatibility.
-
-For more information: https://github.com/scottsen/tiacad
-        """
-    )
-
-    parser.add_argument('--version', action='version', version='TiaCAD 3.1.1')
-    parser.add_argument('--no-color', action='store_true', help='Disable colored output')
-
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # Build command
+def _add_build_parser(subparsers):
     build_parser = subparsers.add_parser('build', help='Build a TiaCAD file to 3MF/STL/STEP (modern 3MF format recommended)')
     build_parser.add_argument('input', help='Input YAML file')
     build_parser.add_argument('-o', '--output', help='Output file (default: same name with .3mf extension - use .stl or .step to override)')
     build_parser.add_argument('-p', '--part', help='Specific part to export (default: last operation)')
     build_parser.add_argument('-s', '--stats', action='store_true', help='Show build statistics')
-    build_parser.add_argument('--validate-schema', action='store_true', help='Enable JSON schema validation')
+    build_parser.add_argument('--validate-schema', action='store_true', help='Enable JSON schema validation (off by default)')
+    build_parser.add_argument('--no-cache', action='store_true', help='Ignore the parsed-document and mesh caches')
     build_parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output with traceback')
     build_parser.set_defaults(func=cmd_build)
 
-    # Validate command
+
+def _add_validate_parser(subparsers):
     validate_parser = subparsers.add_parser('validate', help='Validate YAML files without building')
     validate_parser.add_argument('files', nargs='+', help='YAML file(s) to validate (supports glob patterns)')
     validate_parser.set_defaults(func=cmd_validate)
 
-    # Info command
+
+def _add_info_parser(subparsers):
     info_parser = subparsers.add_parser('info', help='Show information about a TiaCAD file')
     info_parser.add_argument('input', help='Input YAML file')
+    info_parser.add_argument('--strict', action='store_true', help='Enable JSON schema validation (off by default)')
+    info_parser.add_argument('--no-cache', action='store_true', help='Always re-parse instead of using the parsed-document cache')
     info_parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     info_parser.set_defaults(func=cmd_info)
 
-    # Validate-geometry command
+
+def _add_validate_geometry_parser(subparsers):
     validate_geom_parser = subparsers.add_parser(
         'validate-geometry',
         help='Validate geometry is printable (checks for disconnected parts, watertightness)'
     )
     validate_geom_parser.add_argument('input', help='Input YAML file')
     validate_geom_parser.add_argument('-p', '--part', help='Specific part to validate (default: last operation)')
+    validate_geom_parser.add_argument('--strict', action='store_true', help='Enable JSON schema validation (off by default)')
+    validate_geom_parser.add_argument('--no-cache', action='store_true', help='Ignore the parsed-document and mesh caches')
     validate_geom_parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output with component details')
     validate_geom_parser.set_defaults(func=cmd_validate_geometry)
 
+
+# Subcommand name -> function registering its subparser
+SUBCOMMANDS = {
+    'build': _add_build_parser,
+    'validate': _add_validate_parser,
+    'info': _add_info_parser,
+    'validate-geometry': _add_validate_geometry_parser,
+}
+
+
+def _requested_command(argv):
+    """Return the subcommand named in argv, or None if help/unknown/missing"""
+    for arg in argv:
+        if arg in ('-h', '--help'):
+            return None
+        if not arg.startswith('-'):
+            return arg if arg in SUBCOMMANDS else None
+    return None
+
+
+def create_parser(command=None):
+    """
+    Create the argument parser
+
+    Args:
+        command: Only register this subcommand's parser (default: all of them)
+    """
+    parser = argparse.ArgumentParser(
+        prog='tiacad',
+        description='TiaCAD - Declarative Parametric CAD in YAML',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  tiacad build examples/plate.yaml                    # Outputs plate.3mf (modern format)
+  tiacad build examples/plate.yaml -o plate.stl       # Force STL output
+  tiacad build examples/bracket.yaml -o bracket.step  # CAD exchange format
+  tiacad validate examples/*.yaml
+  tiacad info examples/bracket.yaml
+
+Note: 3MF is the recommended format for 3D printing (multi-material, compact, modern).
+      STL is supported for legacy compatibility.
+
+For more information: https://github.com/scottsen/tiacad
+        """
+    )
+
+    parser.add_argument('--version', action='version', version=VERSION_STRING)
+    parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    if command is not None:
+        SUBCOMMANDS[command](subparsers)
+    else:
+        for add_subparser in SUBCOMMANDS.values():
+            add_subparser(subparsers)
+
     return parser
 
 
 def main(argv=None):
     """Main entry point for CLI"""
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Answer --version without building the full parser
+    if argv == ['--version']:
+        print(VERSION_STRING)
+        return 0
+
+    # Only build the subparser that will actually be used
+    parser = create_parser(_requested_command(argv))
     args = parser.parse_args(argv)
 
     # Disable colors if requested or not a TTY
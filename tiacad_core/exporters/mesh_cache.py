@@ -0,0 +1,130 @@
+"""
+Tessellation cache for TiaCAD exporters
+
+Tessellating a part is the slowest step of 3MF export and geometry
+validation. Meshes are stored as .npz files keyed on the TiaCAD version
+and source fingerprint, the source YAML digest, the part name and the
+tolerances, so `tiacad build` followed by `tiacad validate-geometry` on an
+unchanged file tessellates only once. Only the MESH_CACHE_MAX_FILES most
+recently used meshes are kept.
+
+Cache layout:
+    ~/.cache/tiacad/mesh/<version>-<code fingerprint>/<source sha1>/<part>-<tol>-<angtol>.npz
+"""
+
+import logging
+import os
+from itertools import chain
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+from ..utils.cache import cache_root, code_fingerprint, prune_cache
+
+logger = logging.getLogger(__name__)
+
+# Cached meshes kept across all sources; older entries are pruned
+MESH_CACHE_MAX_FILES = 256
+
+
+def mesh_cache_dir() -> Path:
+    """Directory for meshes cached by this TiaCAD build (respects XDG_CACHE_HOME)"""
+    from .. import __version__
+
+    return cache_root() / 'mesh' / f"{__version__}-{code_fingerprint()}"
+
+
+def _cache_file(source_digest: str, part_name: str,
+                tolerance: float, angular_tolerance: float) -> Path:
+    name = f"{quote(part_name, safe='')}-{tolerance!r}-{angular_tolerance!r}.npz"
+    return mesh_cache_dir() / source_digest / name
+
+
+def is_cached(source_digest: Optional[str], part_name: str,
+              tolerance: float, angular_tolerance: float) -> bool:
+    """Check whether a cached mesh exists for this part"""
+    if source_digest is None:
+        return False
+    return _cache_file(source_digest, part_name, tolerance, angular_tolerance).is_file()
+
+
+def tessellate(shape, tolerance: float,
+               angular_tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tessellate a CadQuery shape into NumPy arrays.
+
+    Returns:
+        (vertices, triangles) as (N, 3) float32 and (M, 3) uint32 arrays
+    """
+    cq_vertices, cq_triangles = shape.tessellate(tolerance, angular_tolerance)
+
+    # Fill preallocated buffers without intermediate tuples/lists
+    vertices = np.fromiter(
+        chain.from_iterable((v.x, v.y, v.z) for v in cq_vertices),
+        dtype=np.float32,
+        count=3 * len(cq_vertices)
+    )
+    triangles = np.fromiter(
+        chain.from_iterable(cq_triangles),
+        dtype=np.uint32,
+        count=3 * len(cq_triangles)
+    )
+    return vertices.reshape(-1, 3), triangles.reshape(-1, 3)
+
+
+def tessellate_cached(
+    shape,
+    part_name: str,
+    tolerance: float,
+    angular_tolerance: float,
+    source_digest: Optional[str] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tessellate a shape, reusing a cached mesh for the same source file.
+
+    Without a source_digest the shape is tessellated and nothing is
+    cached. Cache read/write failures fall back to tessellating.
+
+    Args:
+        shape: CadQuery Shape to tessellate
+        part_name: Part name (part of the cache key)
+        tolerance: Linear deflection
+        angular_tolerance: Angular deflection
+        source_digest: SHA1 of the YAML source the shape was built from
+
+    Returns:
+        (vertices, triangles) as (N, 3) float32 and (M, 3) uint32 arrays
+    """
+    if source_digest is None:
+        return tessellate(shape, tolerance, angular_tolerance)
+
+    cache_file = _cache_file(source_digest, part_name, tolerance, angular_tolerance)
+
+    try:
+        with np.load(cache_file) as data:
+            logger.debug(f"Loaded cached mesh for '{part_name}'")
+            vertices, triangles = data['vertices'], data['triangles']
+        os.utime(cache_file)  # Mark as recently used for pruning
+        return vertices, triangles
+    except Exception:
+        pass  # Missing or unreadable cache entry - tessellate normally
+
+    vertices, triangles = tessellate(shape, tolerance, angular_tolerance)
+
+    tmp_file = cache_file.with_suffix('.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            np.savez(f, vertices=vertices, triangles=triangles)
+        tmp_file.replace(cache_file)
+        prune_cache(cache_root() / 'mesh', '*.npz', MESH_CACHE_MAX_FILES)
+    except Exception:
+        # Caching is best-effort (e.g. read-only home)
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    return vertices, triangles
@@ -17,8 +17,20 @@ This exporter leverages TiaCAD's color system to create production-ready
 import logging
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+from . import mesh_cache
+
 logger = logging.getLogger(__name__)
 
+# lib3mf Wrapper loads the native library; create it once per process
+_WRAPPER = None
+
+# Tessellation tolerances (smaller = finer mesh)
+# 0.1 is a good balance between quality and file size
+LINEAR_TOLERANCE = 0.1
+ANGULAR_TOLERANCE = 0.1
+
 
 class ThreeMFExportError(Exception):
     """Error during 3MF export"""
@@ -33,17 +45,29 @@ class ThreeMFExporter:
     3MF file generation.
     """
 
-    def __init__(self):
-        """Initialize 3MF exporter"""
+    def __init__(self, source_digest: Optional[str] = None):
+        """
+        Initialize 3MF exporter
+
+        Args:
+            source_digest: SHA1 of the source YAML; enables the on-disk
+                           tessellation cache (see mesh_cache)
+        """
         self._check_lib3mf()
+        self.source_digest = source_digest
+        # Material key per part (by id), computed once per export
+        self._material_keys: Dict[int, Optional[str]] = {}
 
     def _check_lib3mf(self):
         """Check if lib3mf is available, provide helpful error if not"""
+        global _WRAPPER
         try:
             import lib3mf
             self.lib3mf = lib3mf
-            self.wrapper = lib3mf.Wrapper()
-            logger.debug("lib3mf loaded successfully")
+            if _WRAPPER is None:
+                _WRAPPER = lib3mf.Wrapper()
+                logger.debug("lib3mf loaded successfully")
+            self.wrapper = _WRAPPER
         except ImportError as e:
             raise ThreeMFExportError(
                 "lib3mf library not installed. Install with: pip install lib3mf"
@@ -73,21 +97,27 @@ class ThreeMFExporter:
             # Collect unique materials from all parts
             material_map = self._create_material_groups(model, parts_registry)
 
+            part_names = parts_registry.list_parts()
+            parts = [parts_registry.get(name) for name in part_names]
+
+            # Triangulate uncached parts up front on OCCT's worker threads
+            self._mesh_parts([
+                part for name, part in zip(part_names, parts)
+                if not mesh_cache.is_cached(
+                    self.source_digest, name, LINEAR_TOLERANCE, ANGULAR_TOLERANCE
+                )
+            ])
+
             # Add each part as a mesh object
             part_objects = []
-            for part_name in parts_registry.list_parts():
-                part = parts_registry.get(part_name)
+            for part_name, part in zip(part_names, parts):
 
                 # Create mesh object from CadQuery geometry
                 mesh_object = self._create_mesh_object(model, part, part_name)
 
                 # Assign material if part has color/material
-                if 'color' in part.metadata or 'material' in part.metadata:
-                    self._assign_material(
-                        mesh_object,
-                        part,
-                        material_map
-                    )
+                # (the key was already computed for the material groups)
+                self._assign_material(mesh_object, part, material_map)
 
                 part_objects.append(mesh_object)
 
@@ -121,34 +151,35 @@ class ThreeMFExporter:
         """
         # Collect unique materials
         unique_materials = {}
+        self._material_keys.clear()
 
         for part_name in parts_registry.list_parts():
             part = parts_registry.get(part_name)
 
-            # Determine material key
-            if 'material' in part.metadata:
-                # Named material from library
-                mat_key = f"mat_{part.metadata['material']}"
-                if mat_key not in unique_materials:
-                    # Get RGBA from metadata
-                    if 'color' in part.metadata:
-                        r, g, b, a = part.metadata['color']
-                        unique_materials[mat_key] = {
-                            'name': part.metadata['material'],
-                            'color': (r, g, b, a)
-                        }
-
-            elif 'color' in part.metadata:
-                # Color-only (no named material)
-                r, g, b, a = part.metadata['color']
-                # Create key from color
-                mat_key = f"color_{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-                if mat_key not in unique_materials:
+            mat_key = self._material_key(part)
+            if mat_key is None or mat_key in unique_materials:
+                continue
+
+            material = part.metadata.get('material')
+            color = part.metadata.get('color')
+
+            if material is not None:
+                # Named material from library - needs RGBA from metadata
+                if color is not None:
+                    r, g, b, a = color
                     unique_materials[mat_key] = {
-                        'name': f"Color RGB({int(r*255)},{int(g*255)},{int(b*255)})",
+                        'name': material,
                         'color': (r, g, b, a)
                     }
 
+            else:
+                # Color-only (no named material)
+                r, g, b, a = color
+                unique_materials[mat_key] = {
+                    'name': f"Color RGB({int(r*255)},{int(g*255)},{int(b*255)})",
+                    'color': (r, g, b, a)
+                }
+
         # No materials? Return empty map
         if not unique_materials:
             logger.debug("No materials found, using default gray")
@@ -185,6 +216,71 @@ class ThreeMFExporter:
 
         return material_map
 
+    def _material_key(self, part) -> Optional[str]:
+        """
+        Get the material map key for a part (computed once per export).
+
+        Returns:
+            'mat_<name>' for named materials, 'color_<rrggbb>' for color-only
+            parts, or None if the part has neither
+        """
+        cache_key = id(part)
+        if cache_key in self._material_keys:
+            return self._material_keys[cache_key]
+
+        material = part.metadata.get('material')
+        color = part.metadata.get('color')
+
+        if material is not None:
+            mat_key = f"mat_{material}"
+        elif color is not None:
+            r, g, b, a = color
+            mat_key = f"color_{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+        else:
+            mat_key = None
+
+        self._material_keys[cache_key] = mat_key
+        return mat_key
+
+    def _mesh_parts(self, parts) -> None:
+        """
+        Triangulate all parts in a single multi-threaded OCCT pass.
+
+        The shapes are gathered into one compound and meshed by
+        BRepMesh_IncrementalMesh with parallel mode on, so faces from every
+        part are spread across OCCT's thread pool. The triangulation is
+        stored on the faces, and the per-part tessellate() calls in
+        _create_mesh_object reuse it instead of meshing each part serially.
+        Parts with a cached mesh are left out by the caller.
+
+        Best effort: parts that can't be meshed here are left for
+        _create_mesh_object, which reports the error per part.
+        """
+        try:
+            from OCP.BRep import BRep_Builder
+            from OCP.BRepMesh import BRepMesh_IncrementalMesh
+            from OCP.TopoDS import TopoDS_Compound
+        except ImportError:
+            return
+
+        builder = BRep_Builder()
+        compound = TopoDS_Compound()
+        builder.MakeCompound(compound)
+
+        count = 0
+        for part in parts:
+            try:
+                builder.Add(compound, part.geometry.val().wrapped)
+                count += 1
+            except Exception:
+                continue
+
+        if count:
+            BRepMesh_IncrementalMesh(
+                compound, LINEAR_TOLERANCE, True, ANGULAR_TOLERANCE, True
+            )
+            logger.debug(f"Meshed {count} parts in parallel")
+
     def _create_mesh_object(self, model, part, part_name: str):
         """
         Create mesh object from CadQuery geometry.
@@ -206,29 +302,24 @@ class ThreeMFExporter:
             # Get CadQuery shape
             shape = part.geometry.val()
 
-            # Tessellate with tolerance (smaller = finer mesh)
-            # 0.1 is a good balance between quality and file size
-            cq_vertices, cq_triangles = shape.tessellate(0.1)
-
-            # Convert CadQuery vertices to lib3mf Position objects
-            vertices = []
-            for v in cq_vertices:
-                vertex = self.lib3mf.Position()
-                # Set coordinates individually (c_float_Array_3)
-                vertex.Coordinates[0] = float(v.x)
-                vertex.Coordinates[1] = float(v.y)
-                vertex.Coordinates[2] = float(v.z)
-                vertices.append(vertex)
-
-            # Convert CadQuery triangles to lib3mf Triangle objects
-            triangles = []
-            for tri in cq_triangles:
-                triangle = self.lib3mf.Triangle()
-                # Set indices individually (c_uint_Array_3)
-                triangle.Indices[0] = tri[0]
-                triangle.Indices[1] = tri[1]
-                triangle.Indices[2] = tri[2]
-                triangles.append(triangle)
+            # Tessellate (reuses the triangulation from _mesh_parts, or a
+            # cached mesh from an earlier run on the same source)
+            vertex_data, triangle_data = mesh_cache.tessellate_cached(
+                shape,
+                part_name,
+                LINEAR_TOLERANCE,
+                ANGULAR_TOLERANCE,
+                source_digest=self.source_digest
+            )
+
+            vertex_data, triangle_data = self._deduplicate_vertices(
+                vertex_data, triangle_data
+            )
+
+            # View the buffers as ctypes arrays without copying
+            # (Position = c_float[3], Triangle = c_uint32[3])
+            vertices = (self.lib3mf.Position * len(vertex_data)).from_buffer(vertex_data)
+            triangles = (self.lib3mf.Triangle * len(triangle_data)).from_buffer(triangle_data)
 
             # Set geometry data in mesh object
             mesh_object.SetGeometry(vertices, triangles)
@@ -245,6 +336,45 @@ class ThreeMFExporter:
 
         return mesh_object
 
+    @staticmethod
+    def _deduplicate_vertices(
+        vertex_data: np.ndarray,
+        triangle_data: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merge coincident vertices and remap triangle indices.
+
+        CadQuery tessellates face by face, so vertices on shared edges are
+        emitted once per adjacent face. Triangles that collapse after the
+        merge are dropped.
+
+        Args:
+            vertex_data: (N, 3) float32 vertex positions
+            triangle_data: (M, 3) uint32 vertex indices
+
+        Returns:
+            (vertex_data, triangle_data) with unique vertices, both contiguous
+        """
+        if len(vertex_data) == 0:
+            return vertex_data, triangle_data
+
+        unique_vertices, inverse = np.unique(vertex_data, axis=0, return_inverse=True)
+        remapped = inverse.reshape(-1)[triangle_data].astype(np.uint32)
+
+        # Drop triangles whose corners merged into the same vertex
+        degenerate = (
+            (remapped[:, 0] == remapped[:, 1])
+            | (remapped[:, 1] == remapped[:, 2])
+            | (remapped[:, 0] == remapped[:, 2])
+        )
+        if degenerate.any():
+            remapped = remapped[~degenerate]
+
+        return (
+            np.ascontiguousarray(unique_vertices, dtype=np.float32),
+            np.ascontiguousarray(remapped, dtype=np.uint32),
+        )
+
     def _assign_material(self, mesh_object, part, material_map: Dict):
         """
         Assign material to mesh object.
@@ -254,13 +384,8 @@ class ThreeMFExporter:
             part: Part with metadata
             material_map: Material mapping dictionary
         """
-        # Determine material key (same logic as _create_material_groups)
-        if 'material' in part.metadata:
-            mat_key = f"mat_{part.metadata['material']}"
-        elif 'color' in part.metadata:
-            r, g, b, a = part.metadata['color']
-            mat_key = f"color_{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-        else:
+        mat_key = self._material_key(part)
+        if mat_key is None:
             return  # No material to assign
 
         # Get material IDs
@@ -296,7 +421,8 @@ class ThreeMFExporter:
 def export_3mf(
     parts_registry,
     output_path: str,
-    metadata: Optional[Dict] = None
+    metadata: Optional[Dict] = None,
+    source_digest: Optional[str] = None
 ) -> None:
     """
     Convenience function to export parts to 3MF.
@@ -305,6 +431,7 @@ def export_3mf(
         parts_registry: PartRegistry with parts to export
         output_path: Path to output .3mf file
         metadata: Optional document metadata
+        source_digest: SHA1 of the source YAML, to reuse cached meshes
 
     Raises:
         ThreeMFExportError: If export fails
@@ -313,5 +440,5 @@ def export_3mf(
         >>> from tiacad_core.exporters.threemf_exporter import export_3mf
         >>> export_3mf(doc.parts, "output.3mf", doc.metadata)
     """
-    exporter = ThreeMFExporter()
+    exporter = ThreeMFExporter(source_digest=source_digest)
     exporter.export(parts_registry, output_path, metadata)
@@ -23,12 +23,13 @@ Usage:
     part = Part("test", geometry=box, backend=backend)
 """
 
-from .base import GeometryBackend
+from .base import GeometryBackend, suggest_fuzzy
 from .cadquery_backend import CadQueryBackend
 from .mock_backend import MockBackend, MockGeometry
 
 __all__ = [
     'GeometryBackend',
+    'suggest_fuzzy',
     'CadQueryBackend',
     'MockBackend',
     'MockGeometry',
@@ -0,0 +1,26 @@
+"""
+Vectorized kernels for tessellated meshes.
+
+Operate on the (N, 3) vertex / (M, 3) triangle arrays returned by
+CadQueryBackend.tessellate(); every loop runs inside NumPy.
+"""
+
+import numpy as np
+
+
+def face_normals(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """
+    Unit normal of every triangle (right-hand rule on vertex order).
+
+    Args:
+        vertices: (N, 3) vertex positions
+        triangles: (M, 3) vertex indices
+
+    Returns:
+        (M, 3) float64 array; degenerate triangles get a zero normal
+    """
+    corners = vertices[triangles].astype(np.float64, copy=False)
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 1e-12)
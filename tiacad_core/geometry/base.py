@@ -13,6 +13,30 @@ Design Goals:
 from abc import ABC, abstractmethod
 from typing import Tuple, Dict, Any, List
 
+import numpy as np
+
+
+def suggest_fuzzy(bbox: Dict[str, Tuple[float, float, float]]) -> float:
+    """
+    Suggest a fuzzy tolerance for boolean operations on a model.
+
+    A fuzzy value merges vertices/edges closer than the tolerance before
+    intersecting, which can greatly cut boolean time on messy or large
+    input at the cost of sub-tolerance detail. Useful for previews.
+
+    Args:
+        bbox: Bounding box dict from get_bounding_box()
+
+    Returns:
+        1e-6 times the largest bounding box dimension
+
+    Examples:
+        >>> fuzzy = suggest_fuzzy(backend.get_bounding_box(assembly))
+        >>> result = backend.boolean_union(assembly, part, fuzzy=fuzzy)
+    """
+    extent = max(hi - lo for lo, hi in zip(bbox['min'], bbox['max']))
+    return 1e-6 * extent
+
 
 class GeometryBackend(ABC):
     """
@@ -102,13 +126,15 @@ class GeometryBackend(ABC):
     # ========================================================================
 
     @abstractmethod
-    def boolean_union(self, geom1: Any, geom2: Any) -> Any:
+    def boolean_union(self, geom1: Any, geom2: Any, fuzzy: float = 0.0) -> Any:
         """
         Union two geometries.
 
         Args:
             geom1: First geometry
             geom2: Second geometry
+            fuzzy: Fuzzy tolerance; shapes closer than this are treated as
+                   touching (0.0 = exact, see suggest_fuzzy())
 
         Returns:
             Combined geometry
@@ -119,13 +145,18 @@ class GeometryBackend(ABC):
         pass
 
     @abstractmethod
-    def boolean_difference(self, geom1: Any, geom2: Any) -> Any:
+    def boolean_difference(self, geom1: Any, geom2: Any, fuzzy: float = 0.0) -> Any:
         """
         Subtract geom2 from geom1.
 
+        To subtract several tools, use boolean_difference_many() rather
+        than chaining calls - backends can do it in one operation.
+
         Args:
             geom1: Base geometry
             geom2: Geometry to subtract
+            fuzzy: Fuzzy tolerance; shapes closer than this are treated as
+                   touching (0.0 = exact, see suggest_fuzzy())
 
         Returns:
             Result geometry
@@ -135,14 +166,40 @@ class GeometryBackend(ABC):
         """
         pass
 
+    def boolean_difference_many(self, geom1: Any, others: List[Any], fuzzy: float = 0.0) -> Any:
+        """
+        Subtract several geometries from geom1.
+
+        Default implementation chains boolean_difference(); backends with
+        multi-tool booleans override it to subtract everything at once.
+
+        Args:
+            geom1: Base geometry
+            others: Geometries to subtract
+            fuzzy: Fuzzy tolerance; shapes closer than this are treated as
+                   touching (0.0 = exact, see suggest_fuzzy())
+
+        Returns:
+            Result geometry
+
+        Examples:
+            >>> result = backend.boolean_difference_many(plate, [hole1, hole2, hole3])
+        """
+        result = geom1
+        for geom in others:
+            result = self.boolean_difference(result, geom, fuzzy=fuzzy)
+        return result
+
     @abstractmethod
-    def boolean_intersection(self, geom1: Any, geom2: Any) -> Any:
+    def boolean_intersection(self, geom1: Any, geom2: Any, fuzzy: float = 0.0) -> Any:
         """
         Intersect two geometries.
 
         Args:
             geom1: First geometry
             geom2: Second geometry
+            fuzzy: Fuzzy tolerance; shapes closer than this are treated as
+                   touching (0.0 = exact, see suggest_fuzzy())
 
         Returns:
             Intersection geometry
@@ -422,16 +479,21 @@ class GeometryBackend(ABC):
     # Export (optional - may delegate to exporters)
     # ========================================================================
 
-    def tessellate(self, geom: Any, tolerance: float = 0.1) -> Tuple[List, List]:
+    def tessellate(self, geom: Any, tolerance: float = 0.1,
+                   with_normals: bool = False) -> Tuple[np.ndarray, ...]:
         """
         Convert geometry to triangle mesh.
 
         Args:
             geom: Geometry to tessellate
             tolerance: Tessellation tolerance
+            with_normals: Also return per-triangle unit normals
 
         Returns:
-            Tuple of (vertices, triangles)
+            Tuple of (vertices, triangles), or (vertices, triangles, normals)
+            - vertices: (N, 3) float32 array of vertex positions
+            - triangles: (M, 3) uint32 array of vertex indices
+            - normals: (M, 3) float64 array of face normals
 
         Note:
             This is optional - backends may not support tessellation.
@@ -439,6 +501,8 @@ class GeometryBackend(ABC):
 
         Examples:
             >>> vertices, triangles = backend.tessellate(box)
+            >>> vertices.shape
+            (8, 3)
         """
         raise NotImplementedError(
             f"{self.__class__.__name__} does not support tessellation"
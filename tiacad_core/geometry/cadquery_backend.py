@@ -5,12 +5,122 @@ Wraps CadQuery operations to implement the GeometryBackend interface.
 This is the production backend used for real CAD operations.
 """
 
+import functools
+import math
+import weakref
+
 import cadquery as cq
+import numpy as np
 from typing import Tuple, Dict, Any, List
 
+# OCP ships with CadQuery
+from OCP.BOPAlgo import BOPAlgo_Options
+from OCP.Bnd import Bnd_Box
+from OCP.BRepBndLib import BRepBndLib
+from OCP.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCP.BRepPrimAPI import BRepPrimAPI_MakeCone
+from OCP.gp import gp_Ax2, gp_Dir, gp_Pnt, gp_Trsf
+from OCP.TopLoc import TopLoc_Location
+
+from ..exporters import mesh_cache
+from ._mesh_kernels import face_normals
 from .base import GeometryBackend
 
 
+# Angular deflection for tessellate() (CadQuery's Shape.tessellate default)
+_ANGULAR_TOLERANCE = 0.1
+
+
+@functools.lru_cache(maxsize=32)
+def _scale_trsf(factor: float) -> gp_Trsf:
+    """Uniform scale about the origin (shared by repeated scales)"""
+    trsf = gp_Trsf()
+    trsf.SetScale(gp_Pnt(0, 0, 0), factor)
+    return trsf
+
+
+# Primitives are cached per dimensions and handed out as new TopoDS_Shape
+# handles on the same TShape, so repeated primitives (e.g. the same hole
+# cylinder) share topology and geometry, as OCCT instances do. Each handle
+# carries its own location, so moving one in place never moves the others.
+
+@functools.lru_cache(maxsize=256)
+def _canonical_box(width: float, height: float, depth: float):
+    return cq.Workplane("XY").box(width, depth, height).val().wrapped
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_cylinder(radius: float, height: float):
+    return cq.Workplane("XY").cylinder(height, radius).val().wrapped
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_sphere(radius: float):
+    return cq.Workplane("XY").sphere(radius).val().wrapped
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_cone(radius1: float, radius2: float, height: float):
+    axis = gp_Ax2(gp_Pnt(0, 0, -height / 2), gp_Dir(0, 0, 1))
+    return BRepPrimAPI_MakeCone(axis, radius1, radius2, height).Shape()
+
+
+def _instance(shape) -> cq.Workplane:
+    """Wrap a new handle on a cached primitive in a fresh Workplane"""
+    return cq.Workplane("XY").newObject([cq.Shape.cast(shape.Located(TopLoc_Location()))])
+
+
+def _boxes_overlap(a: Tuple[float, ...], b: Tuple[float, ...]) -> bool:
+    """Whether two (xmin, ymin, zmin, xmax, ymax, zmax) boxes intersect or touch"""
+    return (a[0] <= b[3] and b[0] <= a[3]
+            and a[1] <= b[4] and b[1] <= a[4]
+            and a[2] <= b[5] and b[2] <= a[5])
+
+
+def _loose_box(shapes) -> Tuple[float, float, float, float, float, float]:
+    """Possibly loose box around shapes from BRepBndLib.Add (no optimal fit)"""
+    box = Bnd_Box()
+    for shape in shapes:
+        BRepBndLib.Add_s(shape.wrapped, box, False)
+    return box.Get()
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_selector(selector: str) -> cq.selectors.StringSyntaxSelector:
+    """Parse a selector string once; the parsed selector is reusable"""
+    return cq.selectors.StringSyntaxSelector(selector)
+
+
+def _enable_parallel_booleans() -> None:
+    """
+    Turn on OCCT's process-wide parallel mode for boolean algorithms.
+
+    CadQuery already requests parallel mode on each of its own boolean
+    operations; this also covers OCCT algorithms that fall back to the
+    global default (e.g. those run by fillets, shells and splits).
+    """
+    BOPAlgo_Options.SetParallelMode_s(True)
+
+
+_WARMED_UP = False
+
+
+def _warm_up() -> None:
+    """
+    Run one tiny fuse and bounding box so OCCT's lazy one-time setup
+    (boolean/meshing tool initialization, thread pool start) happens
+    here rather than inside the first real operation. Once per process.
+    """
+    global _WARMED_UP
+    if _WARMED_UP:
+        return
+    _WARMED_UP = True
+
+    box = cq.Solid.makeBox(1, 1, 1)
+    fused = box.fuse(cq.Solid.makeBox(1, 1, 1, cq.Vector(0.5, 0, 0)))
+    BRepBndLib.Add_s(fused.wrapped, Bnd_Box(), False)
+
+
 class CadQueryBackend(GeometryBackend):
     """
     CadQuery implementation of GeometryBackend.
@@ -19,10 +129,52 @@ class CadQueryBackend(GeometryBackend):
     real CAD geometry processing.
     """
 
-    def __init__(self):
-        """Initialize CadQuery backend"""
+    # CadQuery version is fixed for the process
+    _VERSION = getattr(cq, '__version__', "unknown")
+
+    def __init__(self, warm: bool = True):
+        """
+        Initialize CadQuery backend
+
+        Args:
+            warm: Pay OCCT's first-operation setup cost now (once per
+                  process) instead of in the first boolean
+        """
         self.name = "CadQuery"
-        self.version = cq.__version__ if hasattr(cq, '__version__') else "unknown"
+        self.version = self._VERSION
+        _enable_parallel_booleans()
+        if warm:
+            _warm_up()
+
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        """Create the empty per-shape query caches"""
+        # Bounding box per shape as (xmin, ymin, zmin, xmax, ymax, zmax).
+        # CadQuery operations always return new Shape objects, so entries
+        # never go stale; weak keys drop them when the shape is collected.
+        self._bbox_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+        # Selected faces/edges per shape: id(shape) -> (weakref to shape,
+        # {(kind, selector): [...]}). Keyed by identity like the normals:
+        # a reversed shape is equal to the original but selects differently.
+        self._selection_cache: Dict[int, Tuple[weakref.ref, Dict[Tuple[str, str], List[Any]]]] = {}
+
+        # Face normals: id(face) -> (weakref to face, normal). Keyed by
+        # identity, not Shape equality, which ignores orientation.
+        self._normal_cache: Dict[int, Tuple[weakref.ref, Tuple[float, float, float]]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The caches hold weak references, which can't be pickled (e.g. by
+        # the CLI's parsed-document cache); they are rebuilt empty instead
+        state = self.__dict__.copy()
+        for name in ('_bbox_cache', '_selection_cache', '_normal_cache'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_caches()
 
     # ========================================================================
     # Primitive Creation
@@ -30,59 +182,92 @@ class CadQueryBackend(GeometryBackend):
 
     def create_box(self, width: float, height: float, depth: float) -> cq.Workplane:
         """Create a box using CadQuery"""
-        return cq.Workplane("XY").box(width, depth, height)
+        return _instance(_canonical_box(width, height, depth))
 
     def create_cylinder(self, radius: float, height: float) -> cq.Workplane:
         """Create a cylinder using CadQuery"""
-        return cq.Workplane("XY").cylinder(height, radius)
+        return _instance(_canonical_cylinder(radius, height))
 
     def create_sphere(self, radius: float) -> cq.Workplane:
         """Create a sphere using CadQuery"""
-        return cq.Workplane("XY").sphere(radius)
+        return _instance(_canonical_sphere(radius))
 
     def create_cone(self, radius1: float, radius2: float, height: float) -> cq.Workplane:
-        """Create a cone/frustum using CadQuery"""
-        # CadQuery doesn't have a direct cone primitive, use loft between circles
-        if radius2 == 0:
-            # True cone (pointed top)
-            cone = (cq.Workplane("XY")
-                    .circle(radius1)
-                    .workplane(offset=height)
-                    .circle(0.001)  # Very small circle at top (CadQuery doesn't like 0)
-                    .loft())
-        else:
-            # Frustum (truncated cone)
-            cone = (cq.Workplane("XY")
-                    .circle(radius1)
-                    .workplane(offset=height)
-                    .circle(radius2)
-                    .loft())
-        # Center the cone vertically
-        return cone.translate((0, 0, -height/2))
+        """
+        Create a cone/frustum using OCCT's analytic cone primitive.
+
+        The cone is centered vertically, like the other primitives.
+        radius2 == 0 gives a true pointed cone.
+        """
+        if radius1 == radius2:
+            # BRepPrimAPI_MakeCone rejects equal radii - that's a cylinder
+            return self.create_cylinder(radius1, height)
+        return _instance(_canonical_cone(radius1, radius2, height))
 
     # ========================================================================
     # Boolean Operations
     # ========================================================================
 
-    def boolean_union(self, geom1: cq.Workplane, geom2: cq.Workplane) -> cq.Workplane:
+    # CadQuery's boolean ops call SetRunParallel(True) on the OCCT
+    # BRepAlgoAPI operation, so the pave filler and face classification
+    # are already spread across OCCT's thread pool.
+
+    # A fuzzy value of 0.0 maps to tol=None, CadQuery's exact default.
+
+    def boolean_union(self, geom1: cq.Workplane, geom2: cq.Workplane,
+                      fuzzy: float = 0.0) -> cq.Workplane:
         """Union two geometries using CadQuery"""
-        return geom1.union(geom2)
+        return geom1.union(geom2, tol=fuzzy or None)
 
-    def boolean_difference(self, geom1: cq.Workplane, geom2: cq.Workplane) -> cq.Workplane:
+    def boolean_difference(self, geom1: cq.Workplane, geom2: cq.Workplane,
+                           fuzzy: float = 0.0) -> cq.Workplane:
         """Subtract geom2 from geom1 using CadQuery"""
-        return geom1.cut(geom2)
+        return geom1.cut(geom2, tol=fuzzy or None)
 
-    def boolean_intersection(self, geom1: cq.Workplane, geom2: cq.Workplane) -> cq.Workplane:
+    def boolean_difference_many(self, geom1: cq.Workplane, others: List[cq.Workplane],
+                                fuzzy: float = 0.0) -> cq.Workplane:
+        """
+        Subtract several geometries in a single OCCT cut.
+
+        All tool shapes go to one BRepAlgoAPI_Cut, so the base is
+        intersected and classified once instead of once per tool. Tool
+        shapes whose bounding box misses the base's are dropped
+        beforehand - they can't remove anything. Each shape of a
+        multi-object tool is checked on its own.
+        """
+        base_box = self._bbox_upper(geom1)
+        tools = [
+            shape
+            for geom in others
+            for shape in geom.vals()
+            if _boxes_overlap(base_box, _loose_box((shape,)))
+        ]
+        if not tools:
+            return geom1
+        return geom1.cut(cq.Workplane("XY").newObject(tools), tol=fuzzy or None)
+
+    def boolean_intersection(self, geom1: cq.Workplane, geom2: cq.Workplane,
+                             fuzzy: float = 0.0) -> cq.Workplane:
         """Intersect two geometries using CadQuery"""
-        return geom1.intersect(geom2)
+        return geom1.intersect(geom2, tol=fuzzy or None)
 
     # ========================================================================
     # Transforms
     # ========================================================================
 
     def translate(self, geom: cq.Workplane, offset: Tuple[float, float, float]) -> cq.Workplane:
-        """Translate geometry using CadQuery"""
-        return geom.translate(offset)
+        """
+        Translate geometry using CadQuery.
+
+        Moves shapes by attaching a location (the way OCCT positions
+        instances) instead of copying every surface via Shape.translate().
+        Booleans, bounding boxes and tessellation all honour the location.
+        """
+        loc = cq.Location(cq.Vector(*offset))
+        return geom.newObject([
+            obj.moved(loc) if isinstance(obj, cq.Shape) else obj
+            for obj in geom.objects
+        ])
 
     def rotate(
         self,
@@ -99,18 +284,17 @@ class CadQueryBackend(GeometryBackend):
         )
 
     def scale(self, geom: cq.Workplane, factor: float) -> cq.Workplane:
-        """Scale geometry using CadQuery"""
-        # CadQuery doesn't have direct scale, so we use transformGeometry
-        # Note: This is a uniform scale
-        from cadquery import Matrix
-        scale_matrix = Matrix([
-            [factor, 0, 0, 0],
-            [0, factor, 0, 0],
-            [0, 0, factor, 0],
-            [0, 0, 0, 1]
-        ])
+        """
+        Scale geometry uniformly using OCCT.
+
+        Uses BRepBuilderAPI_Transform with a scale gp_Trsf, which rescales
+        the existing curves and surfaces. The general transformGeometry()
+        path (BRepBuilderAPI_GTransform) would convert them to B-splines.
+        """
+        trsf = _scale_trsf(factor)
         return geom.newObject([
-            obj.transformGeometry(scale_matrix)
+            cq.Shape.cast(BRepBuilderAPI_Transform(obj.wrapped, trsf, False).Shape())
+            if isinstance(obj, cq.Shape) else obj
             for obj in geom.objects
         ])
 
@@ -120,16 +304,45 @@ class CadQueryBackend(GeometryBackend):
 
     def fillet(self, geom: cq.Workplane, radius: float, edge_selector: str = "|Z") -> cq.Workplane:
         """Fillet edges using CadQuery"""
-        return geom.edges(edge_selector).fillet(radius)
+        return geom.edges(_compile_selector(edge_selector)).fillet(radius)
 
     def chamfer(self, geom: cq.Workplane, distance: float, edge_selector: str = "|Z") -> cq.Workplane:
         """Chamfer edges using CadQuery"""
-        return geom.edges(edge_selector).chamfer(distance)
+        return geom.edges(_compile_selector(edge_selector)).chamfer(distance)
 
     # ========================================================================
     # Queries
     # ========================================================================
 
+    def _bbox(self, geom: cq.Workplane) -> Tuple[float, float, float, float, float, float]:
+        """Bounding box extents of geom's shape, computed once per shape"""
+        shape = geom.val()
+        extents = self._bbox_cache.get(shape)
+        if extents is None:
+            bbox = shape.BoundingBox()
+            extents = (bbox.xmin, bbox.ymin, bbox.zmin, bbox.xmax, bbox.ymax, bbox.zmax)
+            self._bbox_cache[shape] = extents
+        return extents
+
+    def _bbox_upper(self, geom: cq.Workplane) -> Tuple[float, float, float, float, float, float]:
+        """Possibly loose bounding box of all of geom's shapes (no optimal fit)"""
+        return _loose_box(geom.vals())
+
+    def get_bounding_box_upper(self, geom: cq.Workplane) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Get a cheap bounding box that is guaranteed to contain the geometry.
+
+        Built from curve/surface control points rather than an optimal
+        fit, so it may be larger than get_bounding_box() but never
+        smaller. Good enough for overlap/rejection tests.
+        """
+        xmin, ymin, zmin, xmax, ymax, zmax = self._bbox_upper(geom)
+        return {
+            'min': (xmin, ymin, zmin),
+            'max': (xmax, ymax, zmax),
+            'center': ((xmin + xmax) / 2.0, (ymin + ymax) / 2.0, (zmin + zmax) / 2.0),
+        }
+
     def get_center(self, geom: cq.Workplane) -> Tuple[float, float, float]:
         """
         Get geometric center using CadQuery.
@@ -137,40 +350,65 @@ class CadQueryBackend(GeometryBackend):
         Uses bounding box center as approximation.
         """
         try:
-            bbox = geom.val().BoundingBox()
-            if hasattr(bbox, 'center'):
-                return (bbox.center.x, bbox.center.y, bbox.center.z)
-            else:
-                # Calculate from min/max
-                return (
-                    (bbox.xmin + bbox.xmax) / 2.0,
-                    (bbox.ymin + bbox.ymax) / 2.0,
-                    (bbox.zmin + bbox.zmax) / 2.0,
-                )
+            xmin, ymin, zmin, xmax, ymax, zmax = self._bbox(geom)
         except (AttributeError, RuntimeError, TypeError):
             # Fallback to origin if bbox fails
             return (0.0, 0.0, 0.0)
+        return (
+            (xmin + xmax) / 2.0,
+            (ymin + ymax) / 2.0,
+            (zmin + zmax) / 2.0,
+        )
 
     def get_bounding_box(self, geom: cq.Workplane) -> Dict[str, Tuple[float, float, float]]:
         """Get bounding box using CadQuery"""
-        bbox = geom.val().BoundingBox()
+        xmin, ymin, zmin, xmax, ymax, zmax = self._bbox(geom)
         return {
-            'min': (bbox.xmin, bbox.ymin, bbox.zmin),
-            'max': (bbox.xmax, bbox.ymax, bbox.zmax),
-            'center': self.get_center(geom),
+            'min': (xmin, ymin, zmin),
+            'max': (xmax, ymax, zmax),
+            'center': ((xmin + xmax) / 2.0, (ymin + ymax) / 2.0, (zmin + zmax) / 2.0),
         }
 
     # ========================================================================
     # Selection
     # ========================================================================
 
+    def _select(self, geom: cq.Workplane, kind: str, selector: str) -> List[Any]:
+        """
+        Run a face/edge selection, reusing results for the same shape.
+
+        Only single-shape workplanes are cached; selections on a stack of
+        several objects go straight to CadQuery.
+        """
+        select = geom.faces if kind == 'F' else geom.edges
+        if len(geom.objects) != 1 or not isinstance(geom.objects[0], cq.Shape):
+            return select(_compile_selector(selector)).vals()
+
+        shape = geom.objects[0]
+        shape_key = id(shape)
+        cached = self._selection_cache.get(shape_key)
+        if cached is not None and cached[0]() is shape:
+            selections = cached[1]
+        else:
+            # Drop the entry once the shape is garbage collected
+            cache = self._selection_cache
+            ref = weakref.ref(shape, lambda _, key=shape_key: cache.pop(key, None))
+            selections = {}
+            cache[shape_key] = (ref, selections)
+
+        key = (kind, selector)
+        result = selections.get(key)
+        if result is None:
+            result = selections[key] = select(_compile_selector(selector)).vals()
+        return list(result)
+
     def select_faces(self, geom: cq.Workplane, selector: str) -> List[Any]:
         """Select faces using CadQuery selector"""
-        return geom.faces(selector).vals()
+        return self._select(geom, 'F', selector)
 
     def select_edges(self, geom: cq.Workplane, selector: str) -> List[Any]:
         """Select edges using CadQuery selector"""
-        return geom.edges(selector).vals()
+        return self._select(geom, 'E', selector)
 
     # ========================================================================
     # Spatial Queries (for reference extraction)
@@ -209,10 +447,21 @@ class CadQueryBackend(GeometryBackend):
         Returns:
             Normal vector (nx, ny, nz) - normalized
         """
+        key = id(face)
+        cached = self._normal_cache.get(key)
+        if cached is not None and cached[0]() is face:
+            return cached[1]
+
         # CadQuery faces have normalAt() method
         # Use center point for evaluation
         normal_vec = face.normalAt()
-        return (normal_vec.x, normal_vec.y, normal_vec.z)
+        normal = (normal_vec.x, normal_vec.y, normal_vec.z)
+
+        # Drop the entry once the face is garbage collected
+        cache = self._normal_cache
+        ref = weakref.ref(face, lambda _, key=key: cache.pop(key, None))
+        cache[key] = (ref, normal)
+        return normal
 
     def get_edge_point(self, edge: Any, location: str) -> Tuple[float, float, float]:
         """
@@ -246,6 +495,85 @@ class CadQueryBackend(GeometryBackend):
         else:
             raise ValueError(f"Invalid location '{location}'. Valid: start, end, midpoint")
 
+    def get_face_centers(self, faces: List[Any]) -> np.ndarray:
+        """
+        Get the center points of many faces at once.
+
+        Batch version of get_face_center() writing straight into an
+        (N, 3) array, for callers that go on to do array math.
+
+        Args:
+            faces: CadQuery Face objects
+
+        Returns:
+            (N, 3) array of center points
+        """
+        out = np.empty((len(faces), 3))
+        for i, face in enumerate(faces):
+            try:
+                pt = face.Center()
+            except AttributeError:
+                # Fallback to bounding box center
+                out[i] = self.get_face_center(face)
+                continue
+            out[i, 0] = pt.x
+            out[i, 1] = pt.y
+            out[i, 2] = pt.z
+        return out
+
+    def get_face_normals(self, faces: List[Any]) -> np.ndarray:
+        """
+        Get the normal vectors of many faces at once.
+
+        Args:
+            faces: CadQuery Face objects
+
+        Returns:
+            (N, 3) array of normalized normals
+        """
+        out = np.empty((len(faces), 3))
+        for i, face in enumerate(faces):
+            normal_vec = face.normalAt()
+            out[i, 0] = normal_vec.x
+            out[i, 1] = normal_vec.y
+            out[i, 2] = normal_vec.z
+        return out
+
+    def get_edge_points(self, edges: List[Any], location: str) -> np.ndarray:
+        """
+        Get the same point ('start', 'end' or 'midpoint') on many edges.
+
+        Args:
+            edges: CadQuery Edge objects
+            location: One of 'start', 'end', 'midpoint'
+
+        Returns:
+            (N, 3) array of points
+
+        Raises:
+            ValueError: If location is not valid
+        """
+        if location not in ('start', 'end', 'midpoint'):
+            raise ValueError(f"Invalid location '{location}'. Valid: start, end, midpoint")
+
+        out = np.empty((len(edges), 3))
+        for i, edge in enumerate(edges):
+            if location == 'start':
+                pt = edge.startPoint()
+            elif location == 'end':
+                pt = edge.endPoint()
+            else:
+                # Use bounding box center as approximation (as get_edge_point)
+                bbox = edge.BoundingBox()
+                out[i, 0] = (bbox.xmin + bbox.xmax) / 2
+                out[i, 1] = (bbox.ymin + bbox.ymax) / 2
+                out[i, 2] = (bbox.zmin + bbox.zmax) / 2
+                continue
+            out[i, 0] = pt.x
+            out[i, 1] = pt.y
+            out[i, 2] = pt.z
+        return out
+
     def get_edge_tangent(self, edge: Any) -> Tuple[float, float, float]:
         """
         Get the tangent vector of an edge.
@@ -272,27 +600,67 @@ class CadQueryBackend(GeometryBackend):
         dz = end_pt.z - start_pt.z
 
         # Normalize
-        length = (dx**2 + dy**2 + dz**2)**0.5
+        length = math.hypot(dx, dy, dz)
         if length < 1e-10:
             raise ValueError("Edge has zero length, cannot compute tangent")
 
         return (dx / length, dy / length, dz / length)
 
+    def get_edge_tangents(self, edges: List[Any]) -> np.ndarray:
+        """
+        Get the tangent vectors of many edges at once.
+
+        Batch version of get_edge_tangent(): the start-to-end vectors are
+        normalized in one NumPy pass instead of per edge in Python.
+
+        Args:
+            edges: CadQuery Edge objects
+
+        Returns:
+            (N, 3) array of normalized tangents
+
+        Raises:
+            ValueError: If any edge has zero length
+        """
+        points = np.empty((len(edges), 2, 3))
+        for i, edge in enumerate(edges):
+            start_pt = edge.startPoint()
+            end_pt = edge.endPoint()
+            points[i, 0] = (start_pt.x, start_pt.y, start_pt.z)
+            points[i, 1] = (end_pt.x, end_pt.y, end_pt.z)
+
+        directions = points[:, 1] - points[:, 0]
+        lengths = np.linalg.norm(directions, axis=1, keepdims=True)
+        if np.any(lengths < 1e-10):
+            raise ValueError("Edge has zero length, cannot compute tangent")
+
+        return directions / lengths
+
     # ========================================================================
     # Export/Tessellation
     # ========================================================================
 
-    def tessellate(self, geom: cq.Workplane, tolerance: float = 0.1) -> Tuple[List, List]:
+    def tessellate(self, geom: cq.Workplane, tolerance: float = 0.1,
+                   with_normals: bool = False) -> Tuple[np.ndarray, ...]:
         """
         Tessellate geometry to triangle mesh using CadQuery.
 
+        Args:
+            geom: Geometry to tessellate
+            tolerance: Tessellation tolerance
+            with_normals: Also return per-triangle unit normals
+
         Returns:
-            Tuple of (vertices, triangles)
-            - vertices: List of vertex objects (with .x, .y, .z attributes)
-            - triangles: List of triangle tuples (v0, v1, v2 indices)
+            Tuple of (vertices, triangles), or (vertices, triangles, normals)
+            - vertices: (N, 3) float32 array of vertex positions
+            - triangles: (M, 3) uint32 array of vertex indices
+            - normals: (M, 3) float64 array of face normals
         """
-        shape = geom.val()
-        vertices, triangles = shape.tessellate(tolerance)
+        # Same conversion as the exporters' mesh path, so the two can't drift
+        vertices, triangles = mesh_cache.tessellate(geom.val(), tolerance, _ANGULAR_TOLERANCE)
+
+        if with_normals:
+            return vertices, triangles, face_normals(vertices, triangles)
         return vertices, triangles
 
     def __repr__(self) -> str:
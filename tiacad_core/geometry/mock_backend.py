@@ -11,12 +11,19 @@ Benefits:
 - Easy to verify test logic
 """
 
-from dataclasses import dataclass, field
-from typing import Tuple, Dict, Any, List, Optional
+import functools
+import math
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Tuple, Dict, Any, Callable, List, Mapping, Optional
+
+import numpy as np
+
+from ._mesh_kernels import face_normals
 from .base import GeometryBackend
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockFace:
     """Mock face object for testing"""
     center: Tuple[float, float, float]
@@ -24,15 +31,90 @@ class MockFace:
     name: str = "MockFace"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockEdge:
     """Mock edge object for testing"""
     start: Tuple[float, float, float]
     end: Tuple[float, float, float]
     name: str = "MockEdge"
 
-
-@dataclass
+    @staticmethod
+    def pack(edges: List['MockEdge']) -> np.ndarray:
+        """Pack edge endpoints into an (N, 2, 3) array of (start, end) rows"""
+        return np.array([(edge.start, edge.end) for edge in edges], dtype=np.float64).reshape(-1, 2, 3)
+
+
+def _box_bounds(p: Mapping[str, Any], center: Tuple[float, float, float]) -> Dict[str, Tuple]:
+    half_w = p.get('width', 10) * 0.5
+    half_h = p.get('height', 10) * 0.5
+    half_d = p.get('depth', 10) * 0.5
+    return {
+        'min': (-half_w, -half_d, -half_h),
+        'max': (half_w, half_d, half_h),
+        'center': center
+    }
+
+
+def _cylinder_bounds(p: Mapping[str, Any], center: Tuple[float, float, float]) -> Dict[str, Tuple]:
+    r = p.get('radius', 5)
+    half_h = p.get('height', 20) * 0.5
+    return {
+        'min': (-r, -r, -half_h),
+        'max': (r, r, half_h),
+        'center': center
+    }
+
+
+def _sphere_bounds(p: Mapping[str, Any], center: Tuple[float, float, float]) -> Dict[str, Tuple]:
+    r = p.get('radius', 10)
+    return {
+        'min': (-r, -r, -r),
+        'max': (r, r, r),
+        'center': center
+    }
+
+
+def _cone_bounds(p: Mapping[str, Any], center: Tuple[float, float, float]) -> Dict[str, Tuple]:
+    max_r = max(p.get('radius1', 5), p.get('radius2', 2))  # Base/top radius
+    half_h = p.get('height', 20) * 0.5
+    return {
+        'min': (-max_r, -max_r, -half_h),
+        'max': (max_r, max_r, half_h),
+        'center': center
+    }
+
+
+def _default_bounds(p: Mapping[str, Any], center: Tuple[float, float, float]) -> Dict[str, Tuple]:
+    # Default: unit box
+    return {
+        'min': (-0.5, -0.5, -0.5),
+        'max': (0.5, 0.5, 0.5),
+        'center': center
+    }
+
+
+# Default bounds per primitive shape type - (parameters, center) -> bounds
+_BOUNDS_FN: Dict[str, Callable[[Mapping[str, Any], Tuple[float, float, float]], Dict[str, Tuple]]] = {
+    'box': _box_bounds,
+    'cylinder': _cylinder_bounds,
+    'sphere': _sphere_bounds,
+    'cone': _cone_bounds,
+}
+
+
+def _shift_bounds(bounds: Dict[str, Tuple], offset: Tuple[float, float, float]) -> Dict[str, Tuple]:
+    """Translate a bounds dict by offset (its 'center' is kept as-is)"""
+    ox, oy, oz = offset
+    min_x, min_y, min_z = bounds['min']
+    max_x, max_y, max_z = bounds['max']
+    return {
+        'min': (min_x + ox, min_y + oy, min_z + oz),
+        'max': (max_x + ox, max_y + oy, max_z + oz),
+        'center': bounds['center']
+    }
+
+
+@dataclass(frozen=True, slots=True)
 class MockGeometry:
     """
     Lightweight mock geometry for testing.
@@ -45,110 +127,207 @@ class MockGeometry:
 
     This allows fast unit testing of TiaCAD logic without
     slow CAD kernel operations.
+
+    Instances are immutable: parameters are exposed read-only and
+    operation_history is a tuple, so derived values (bounds, hash) are
+    computed once and cached on the instance.
     """
 
     shape_type: str  # "box", "cylinder", "sphere", "union", etc.
-    parameters: Dict[str, Any] = field(default_factory=dict)
+    parameters: Mapping[str, Any] = field(default_factory=dict)
     center: Tuple[float, float, float] = (0.0, 0.0, 0.0)
-    bounds: Optional[Dict[str, Tuple]] = None
-    operation_history: List[str] = field(default_factory=list)
+    operation_history: Tuple[str, ...] = ()
+    # Translation applied (via with_center) since the default bounds were valid
+    _bounds_offset: Tuple[float, float, float] = field(default=(0.0, 0.0, 0.0), repr=False)
+    _bounds_cache: Optional[Dict[str, Tuple]] = field(default=None, repr=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Calculate reasonable bounds based on shape type"""
-        if self.bounds is None:
-            self.bounds = self._calculate_default_bounds()
+        """Freeze parameters and history (bounds are computed lazily)"""
+        # The parameters dict is wrapped, not copied: constructors hand over
+        # a fresh dict, and replace() passes the existing read-only view
+        if not isinstance(self.parameters, MappingProxyType):
+            object.__setattr__(self, 'parameters', MappingProxyType(self.parameters))
+        if not isinstance(self.operation_history, tuple):
+            object.__setattr__(self, 'operation_history', tuple(self.operation_history))
+
+    @property
+    def bounds(self) -> Dict[str, Tuple]:
+        """Bounding box, calculated from shape type on first access"""
+        bounds = self._bounds_cache
+        if bounds is None:
+            bounds = self._calculate_default_bounds()
+            if self._bounds_offset != (0.0, 0.0, 0.0):
+                bounds = _shift_bounds(bounds, self._bounds_offset)
+            object.__setattr__(self, '_bounds_cache', bounds)
+        return bounds
+
+    def __hash__(self) -> int:
+        # Parameters may hold unhashable values (operand lists), so hash
+        # the remaining identity fields - equal geometries still collide
+        h = self._hash
+        if h is None:
+            h = hash((self.shape_type, self.center, self.operation_history))
+            object.__setattr__(self, '_hash', h)
+        return h
 
     def _calculate_default_bounds(self) -> Dict[str, Tuple]:
         """Calculate reasonable bounding box for shape type"""
-        if self.shape_type == 'box':
-            w = self.parameters.get('width', 10)
-            h = self.parameters.get('height', 10)
-            d = self.parameters.get('depth', 10)
-            return {
-                'min': (-w/2, -d/2, -h/2),
-                'max': (w/2, d/2, h/2),
-                'center': self.center
-            }
-
-        elif self.shape_type == 'cylinder':
-            r = self.parameters.get('radius', 5)
-            h = self.parameters.get('height', 20)
-            return {
-                'min': (-r, -r, -h/2),
-                'max': (r, r, h/2),
-                'center': self.center
-            }
-
-        elif self.shape_type == 'sphere':
-            r = self.parameters.get('radius', 10)
-            return {
-                'min': (-r, -r, -r),
-                'max': (r, r, r),
-                'center': self.center
-            }
-
-        elif self.shape_type == 'cone':
-            r1 = self.parameters.get('radius1', 5)  # Base radius
-            r2 = self.parameters.get('radius2', 2)  # Top radius
-            h = self.parameters.get('height', 20)
-            max_r = max(r1, r2)
-            return {
-                'min': (-max_r, -max_r, -h/2),
-                'max': (max_r, max_r, h/2),
-                'center': self.center
-            }
-
-        else:
-            # Default: unit box
-            return {
-                'min': (-0.5, -0.5, -0.5),
-                'max': (0.5, 0.5, 0.5),
-                'center': self.center
-            }
+        return _BOUNDS_FN.get(self.shape_type, _default_bounds)(self.parameters, self.center)
 
     def with_center(self, new_center: Tuple[float, float, float]) -> 'MockGeometry':
-        """Create copy with new center"""
-        return MockGeometry(
-            shape_type=self.shape_type,
-            parameters=self.parameters.copy(),
+        """Create copy with new center (bounds are shifted on first access)"""
+        old_center = self.center
+        offset = self._bounds_offset
+        return replace(
+            self,
             center=new_center,
-            bounds=self._recalculate_bounds(new_center),
-            operation_history=self.operation_history.copy()
+            _bounds_offset=(
+                offset[0] + new_center[0] - old_center[0],
+                offset[1] + new_center[1] - old_center[1],
+                offset[2] + new_center[2] - old_center[2],
+            ),
+            _bounds_cache=None
         )
 
-    def _recalculate_bounds(self, new_center: Tuple[float, float, float]) -> Dict:
-        """Recalculate bounds for new center"""
-        if self.bounds is None:
-            return None
-
-        old_center = self.center
-        offset = tuple(new_center[i] - old_center[i] for i in range(3))
-
-        old_min = self.bounds['min']
-        old_max = self.bounds['max']
-
-        return {
-            'min': tuple(old_min[i] + offset[i] for i in range(3)),
-            'max': tuple(old_max[i] + offset[i] for i in range(3)),
-            'center': new_center
-        }
-
     def add_operation(self, operation: str) -> 'MockGeometry':
         """Record an operation in history"""
-        new_history = self.operation_history.copy()
-        new_history.append(operation)
-        return MockGeometry(
-            shape_type=self.shape_type,
-            parameters=self.parameters.copy(),
-            center=self.center,
-            bounds=self.bounds.copy() if self.bounds else None,
-            operation_history=new_history
-        )
+        return replace(self, operation_history=self.operation_history + (operation,))
 
     def __repr__(self) -> str:
         return f"MockGeometry(type={self.shape_type}, center={self.center}, ops={len(self.operation_history)})"
 
 
+# ============================================================================
+# Selector Tables
+# ============================================================================
+# Face builders take (min, max, center) of the bounding box, edge builders
+# take (min, max). Names and normals are shared constants so selection does
+# no formatting and every face of one orientation shares one normal tuple.
+
+_N_POS_X = (1.0, 0.0, 0.0)
+_N_NEG_X = (-1.0, 0.0, 0.0)
+_N_POS_Y = (0.0, 1.0, 0.0)
+_N_NEG_Y = (0.0, -1.0, 0.0)
+_N_POS_Z = (0.0, 0.0, 1.0)
+_N_NEG_Z = (0.0, 0.0, -1.0)
+
+
+def _top_face(lo, hi, c) -> MockFace:
+    return MockFace(center=(c[0], c[1], hi[2]), normal=_N_POS_Z, name="MockFace->Z")
+
+
+def _bottom_face(lo, hi, c) -> MockFace:
+    return MockFace(center=(c[0], c[1], lo[2]), normal=_N_NEG_Z, name="MockFace-<Z")
+
+
+def _right_face(lo, hi, c) -> MockFace:
+    return MockFace(center=(hi[0], c[1], c[2]), normal=_N_POS_X, name="MockFace->X")
+
+
+def _left_face(lo, hi, c) -> MockFace:
+    return MockFace(center=(lo[0], c[1], c[2]), normal=_N_NEG_X, name="MockFace-<X")
+
+
+def _front_face(lo, hi, c) -> MockFace:
+    return MockFace(center=(c[0], hi[1], c[2]), normal=_N_POS_Y, name="MockFace->Y")
+
+
+def _back_face(lo, hi, c) -> MockFace:
+    return MockFace(center=(c[0], lo[1], c[2]), normal=_N_NEG_Y, name="MockFace-<Y")
+
+
+# Box corners: bottom ring (zmin) then top ring (zmax), True = take max
+_BOX_CORNER_MASK = np.array([
+    [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],  # Bottom
+    [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],  # Top
+], dtype=bool)
+
+
+def _box_corners(lo, hi) -> np.ndarray:
+    """(8, 3) array of bounding box corners, ordered as _BOX_CORNER_MASK"""
+    return np.where(_BOX_CORNER_MASK, hi, lo)
+
+
+# (shape_type, selector) -> face builder. Boxes have all six faces;
+# cylinders, spheres and cones only their top/bottom faces (or points).
+_FACE_TABLE: Dict[Tuple[str, str], Callable[..., MockFace]] = {
+    ('box', '>X'): _right_face,
+    ('box', '<X'): _left_face,
+    ('box', '>Y'): _front_face,
+    ('box', '<Y'): _back_face,
+}
+for _shape_type in ('box', 'cylinder', 'sphere', 'cone'):
+    _FACE_TABLE[(_shape_type, '>Z')] = _top_face
+    _FACE_TABLE[(_shape_type, '<Z')] = _bottom_face
+del _shape_type
+
+# (shape_type, selector) -> (start, end) corner index pairs
+_EDGE_TABLE: Dict[Tuple[str, str], Tuple[Tuple[int, int], ...]] = {
+    ('box', '|Z'): ((0, 4), (1, 5), (2, 6), (3, 7)),  # Vertical edges (parallel to Z)
+    ('box', '|X'): ((0, 1), (3, 2)),                  # Edges parallel to X
+}
+_EDGE_NAMES: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    key: tuple(f"MockEdge-{key[1]}-{i}" for i in range(len(pairs)))
+    for key, pairs in _EDGE_TABLE.items()
+}
+
+
+# ============================================================================
+# Shared Primitives
+# ============================================================================
+# MockGeometry is immutable, so identical primitives are shared instead of
+# rebuilt. typed=True keeps e.g. width=10 and width=10.0 as separate entries.
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _mock_box(width: float, height: float, depth: float) -> MockGeometry:
+    return MockGeometry(
+        shape_type='box',
+        parameters={'width': width, 'height': height, 'depth': depth}
+    )
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _mock_cylinder(radius: float, height: float) -> MockGeometry:
+    return MockGeometry(
+        shape_type='cylinder',
+        parameters={'radius': radius, 'height': height}
+    )
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _mock_sphere(radius: float) -> MockGeometry:
+    return MockGeometry(
+        shape_type='sphere',
+        parameters={'radius': radius}
+    )
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _mock_cone(radius1: float, radius2: float, height: float) -> MockGeometry:
+    return MockGeometry(
+        shape_type='cone',
+        parameters={'radius1': radius1, 'radius2': radius2, 'height': height}
+    )
+
+
+# Simple box mesh returned by MockBackend.tessellate()
+_MOCK_VERTICES = np.array([
+    (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),  # Bottom
+    (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),      # Top
+], dtype=np.float32)
+_MOCK_TRIANGLES = np.array([
+    (0, 1, 2), (0, 2, 3),  # Bottom
+    (4, 5, 6), (4, 6, 7),  # Top
+    (0, 1, 5), (0, 5, 4),  # Sides...
+    (1, 2, 6), (1, 6, 5),
+    (2, 3, 7), (2, 7, 6),
+    (3, 0, 4), (3, 4, 7),
+], dtype=np.uint32)
+_MOCK_VERTICES.flags.writeable = False  # Shared by every call
+_MOCK_TRIANGLES.flags.writeable = False
+
+
 class MockBackend(GeometryBackend):
     """
     Fast mock backend for unit testing.
@@ -164,11 +343,25 @@ class MockBackend(GeometryBackend):
     - Easy to test TiaCAD logic
     """
 
-    def __init__(self):
-        """Initialize mock backend"""
+    def __init__(self, track_history: bool = False):
+        """
+        Initialize mock backend
+
+        Args:
+            track_history: Record each operation in the resulting geometry's
+                operation_history (off by default - it costs a label and a
+                tuple copy per operation; enable it in tests that assert on it)
+        """
         self.name = "Mock"
         self.version = "1.0"
         self.operations_count = 0  # Track total operations
+        self.track_history = track_history
+
+    def _history(self, geom: MockGeometry, operation: str) -> Tuple[str, ...]:
+        """operation_history for a result derived from geom"""
+        if self.track_history:
+            return geom.operation_history + (operation,)
+        return geom.operation_history
 
     # ========================================================================
     # Primitive Creation
@@ -177,67 +370,55 @@ class MockBackend(GeometryBackend):
     def create_box(self, width: float, height: float, depth: float) -> MockGeometry:
         """Create mock box"""
         self.operations_count += 1
-        return MockGeometry(
-            shape_type='box',
-            parameters={'width': width, 'height': height, 'depth': depth}
-        )
+        return _mock_box(width, height, depth)
 
     def create_cylinder(self, radius: float, height: float) -> MockGeometry:
         """Create mock cylinder"""
         self.operations_count += 1
-        return MockGeometry(
-            shape_type='cylinder',
-            parameters={'radius': radius, 'height': height}
-        )
+        return _mock_cylinder(radius, height)
 
     def create_sphere(self, radius: float) -> MockGeometry:
         """Create mock sphere"""
         self.operations_count += 1
-        return MockGeometry(
-            shape_type='sphere',
-            parameters={'radius': radius}
-        )
+        return _mock_sphere(radius)
 
     def create_cone(self, radius1: float, radius2: float, height: float) -> MockGeometry:
         """Create mock cone/frustum"""
         self.operations_count += 1
-        return MockGeometry(
-            shape_type='cone',
-            parameters={'radius1': radius1, 'radius2': radius2, 'height': height}
-        )
+        return _mock_cone(radius1, radius2, height)
 
     # ========================================================================
     # Boolean Operations
     # ========================================================================
 
-    def boolean_union(self, geom1: MockGeometry, geom2: MockGeometry) -> MockGeometry:
+    def boolean_union(self, geom1: MockGeometry, geom2: MockGeometry, fuzzy: float = 0.0) -> MockGeometry:
         """Mock union - just record the operation"""
         self.operations_count += 1
         return MockGeometry(
             shape_type='union',
             parameters={'operands': [geom1, geom2]},
             center=geom1.center,  # Use first geometry's center
-            operation_history=geom1.operation_history + ['union']
+            operation_history=self._history(geom1, 'union')
         )
 
-    def boolean_difference(self, geom1: MockGeometry, geom2: MockGeometry) -> MockGeometry:
+    def boolean_difference(self, geom1: MockGeometry, geom2: MockGeometry, fuzzy: float = 0.0) -> MockGeometry:
         """Mock difference - just record the operation"""
         self.operations_count += 1
         return MockGeometry(
             shape_type='difference',
             parameters={'base': geom1, 'subtract': geom2},
             center=geom1.center,
-            operation_history=geom1.operation_history + ['difference']
+            operation_history=self._history(geom1, 'difference')
         )
 
-    def boolean_intersection(self, geom1: MockGeometry, geom2: MockGeometry) -> MockGeometry:
+    def boolean_intersection(self, geom1: MockGeometry, geom2: MockGeometry, fuzzy: float = 0.0) -> MockGeometry:
         """Mock intersection - just record the operation"""
         self.operations_count += 1
         return MockGeometry(
             shape_type='intersection',
             parameters={'operands': [geom1, geom2]},
             center=geom1.center,
-            operation_history=geom1.operation_history + ['intersection']
+            operation_history=self._history(geom1, 'intersection')
         )
 
     # ========================================================================
@@ -247,8 +428,12 @@ class MockBackend(GeometryBackend):
     def translate(self, geom: MockGeometry, offset: Tuple[float, float, float]) -> MockGeometry:
         """Mock translate - just update center"""
         self.operations_count += 1
-        new_center = tuple(geom.center[i] + offset[i] for i in range(3))
-        return geom.with_center(new_center).add_operation(f'translate{offset}')
+        c = geom.center
+        new_center = (c[0] + offset[0], c[1] + offset[1], c[2] + offset[2])
+        moved = geom.with_center(new_center)
+        if self.track_history:
+            moved = moved.add_operation(f'translate{offset}')
+        return moved
 
     def rotate(
         self,
@@ -259,7 +444,9 @@ class MockBackend(GeometryBackend):
     ) -> MockGeometry:
         """Mock rotate - just record operation (center unchanged for simple shapes)"""
         self.operations_count += 1
-        return geom.add_operation(f'rotate({angle}°)')
+        if self.track_history:
+            geom = geom.add_operation(f'rotate({angle}°)')
+        return geom
 
     def scale(self, geom: MockGeometry, factor: float) -> MockGeometry:
         """Mock scale - multiply parameters"""
@@ -273,11 +460,16 @@ class MockBackend(GeometryBackend):
             else:
                 new_params[key] = value
 
-        return MockGeometry(
-            shape_type=geom.shape_type,
+        history = geom.operation_history
+        if self.track_history:
+            history += (f'scale({factor})',)
+
+        return replace(
+            geom,
             parameters=new_params,
-            center=geom.center,
-            operation_history=geom.operation_history + [f'scale({factor})']
+            operation_history=history,
+            _bounds_offset=(0.0, 0.0, 0.0),
+            _bounds_cache=None
         )
 
     # ========================================================================
@@ -287,12 +479,16 @@ class MockBackend(GeometryBackend):
     def fillet(self, geom: MockGeometry, radius: float, edge_selector: str = "|Z") -> MockGeometry:
         """Mock fillet - just record operation"""
         self.operations_count += 1
-        return geom.add_operation(f'fillet(r={radius}, edges={edge_selector})')
+        if self.track_history:
+            geom = geom.add_operation(f'fillet(r={radius}, edges={edge_selector})')
+        return geom
 
     def chamfer(self, geom: MockGeometry, distance: float, edge_selector: str = "|Z") -> MockGeometry:
         """Mock chamfer - just record operation"""
         self.operations_count += 1
-        return geom.add_operation(f'chamfer(d={distance}, edges={edge_selector})')
+        if self.track_history:
+            geom = geom.add_operation(f'chamfer(d={distance}, edges={edge_selector})')
+        return geom
 
     # ========================================================================
     # Queries
@@ -312,136 +508,53 @@ class MockBackend(GeometryBackend):
 
     def select_faces(self, geom: MockGeometry, selector: str) -> List[MockFace]:
         """Mock face selection - return mock face objects"""
-        # For testing purposes, return mock faces based on selector
-        # Parse selector to determine which face (e.g., ">Z" = top face)
+        # Look up the face builder for this shape/selector (e.g., ">Z" = top face)
+        builder = _FACE_TABLE.get((geom.shape_type, selector))
+        if builder is None:
+            # Default: return a generic face at center
+            return [MockFace(
+                center=geom.center,
+                normal=_N_POS_Z,
+                name=f"MockFace-{selector}"
+            )]
 
-        # Get bounding box for all shape types
         bbox = geom.bounds
-        xmin, ymin, zmin = bbox['min']
-        xmax, ymax, zmax = bbox['max']
-        cx, cy, cz = bbox['center']
-
-        if geom.shape_type == 'box':
-            # Define standard box faces based on selector
-            if selector == '>Z':  # Top face
-                return [MockFace(
-                    center=(cx, cy, zmax),
-                    normal=(0, 0, 1),
-                    name=f"MockFace-{selector}"
-                )]
-            elif selector == '<Z':  # Bottom face
-                return [MockFace(
-                    center=(cx, cy, zmin),
-                    normal=(0, 0, -1),
-                    name=f"MockFace-{selector}"
-                )]
-            elif selector == '>X':  # Right face
-                return [MockFace(
-                    center=(xmax, cy, cz),
-                    normal=(1, 0, 0),
-                    name=f"MockFace-{selector}"
-                )]
-            elif selector == '<X':  # Left face
-                return [MockFace(
-                    center=(xmin, cy, cz),
-                    normal=(-1, 0, 0),
-                    name=f"MockFace-{selector}"
-                )]
-            elif selector == '>Y':  # Front face
-                return [MockFace(
-                    center=(cx, ymax, cz),
-                    normal=(0, 1, 0),
-                    name=f"MockFace-{selector}"
-                )]
-            elif selector == '<Y':  # Back face
-                return [MockFace(
-                    center=(cx, ymin, cz),
-                    normal=(0, -1, 0),
-                    name=f"MockFace-{selector}"
-                )]
-
-        elif geom.shape_type == 'cylinder':
-            # Cylinder has top and bottom circular faces
-            if selector == '>Z':  # Top face
-                return [MockFace(
-                    center=(cx, cy, zmax),
-                    normal=(0, 0, 1),
-                    name=f"MockFace-{selector}"
-                )]
-            elif selector == '<Z':  # Bottom face
-                return [MockFace(
-                    center=(cx, cy, zmin),
-                    normal=(0, 0, -1),
-                    name=f"MockFace-{selector}"
-                )]
-
-        elif geom.shape_type == 'sphere':
-            # Sphere has top and bottom points
-            if selector == '>Z':  # Top point
-                return [MockFace(
-                    center=(cx, cy, zmax),
-                    normal=(0, 0, 1),
-                    name=f"MockFace-{selector}"
-                )]
-            elif selector == '<Z':  # Bottom point
-                return [MockFace(
-                    center=(cx, cy, zmin),
-                    normal=(0, 0, -1),
-                    name=f"MockFace-{selector}"
-                )]
-
-        elif geom.shape_type == 'cone':
-            # Cone has top and bottom circular faces
-            if selector == '>Z':  # Top face
-                return [MockFace(
-                    center=(cx, cy, zmax),
-                    normal=(0, 0, 1),
-                    name=f"MockFace-{selector}"
-                )]
-            elif selector == '<Z':  # Bottom face
-                return [MockFace(
-                    center=(cx, cy, zmin),
-                    normal=(0, 0, -1),
-                    name=f"MockFace-{selector}"
-                )]
-
-        # Default: return a generic face at center
-        return [MockFace(
-            center=geom.center,
-            normal=(0, 0, 1),
-            name=f"MockFace-{selector}"
-        )]
+        return [builder(bbox['min'], bbox['max'], bbox['center'])]
 
     def select_edges(self, geom: MockGeometry, selector: str) -> List[MockEdge]:
         """Mock edge selection - return mock edge objects"""
-        # For testing, return mock edges based on selector
-
-        if geom.shape_type == 'box':
-            bbox = geom.bounds
-            xmin, ymin, zmin = bbox['min']
-            xmax, ymax, zmax = bbox['max']
-
-            # Define standard box edges based on selector
-            if selector == '|Z':  # Vertical edges (parallel to Z)
-                return [
-                    MockEdge(start=(xmin, ymin, zmin), end=(xmin, ymin, zmax), name=f"MockEdge-{selector}-0"),
-                    MockEdge(start=(xmax, ymin, zmin), end=(xmax, ymin, zmax), name=f"MockEdge-{selector}-1"),
-                    MockEdge(start=(xmax, ymax, zmin), end=(xmax, ymax, zmax), name=f"MockEdge-{selector}-2"),
-                    MockEdge(start=(xmin, ymax, zmin), end=(xmin, ymax, zmax), name=f"MockEdge-{selector}-3"),
-                ]
-            elif selector == '|X':  # Edges parallel to X
-                return [
-                    MockEdge(start=(xmin, ymin, zmin), end=(xmax, ymin, zmin), name=f"MockEdge-{selector}-0"),
-                    MockEdge(start=(xmin, ymax, zmin), end=(xmax, ymax, zmin), name=f"MockEdge-{selector}-1"),
-                ]
-
-        # Default: return a generic edge
-        cx, cy, cz = geom.center
-        return [MockEdge(
-            start=(cx - 1, cy, cz),
-            end=(cx + 1, cy, cz),
-            name=f"MockEdge-{selector}"
-        )]
+        key = (geom.shape_type, selector)
+        pairs = _EDGE_TABLE.get(key)
+        if pairs is None:
+            # Default: return a generic edge
+            cx, cy, cz = geom.center
+            return [MockEdge(
+                start=(cx - 1, cy, cz),
+                end=(cx + 1, cy, cz),
+                name=f"MockEdge-{selector}"
+            )]
+
+        bbox = geom.bounds
+        corners = _box_corners(bbox['min'], bbox['max']).tolist()
+        return [
+            MockEdge(start=tuple(corners[i]), end=tuple(corners[j]), name=name)
+            for (i, j), name in zip(pairs, _EDGE_NAMES[key])
+        ]
+
+    def select_edges_batch(self, geom: MockGeometry, selector: str) -> np.ndarray:
+        """
+        Mock edge selection returning endpoints instead of edge objects.
+
+        Returns:
+            (N, 2, 3) array of (start, end) rows, as MockEdge.pack() would
+            give for select_edges(), ready for get_edge_tangents-style math
+        """
+        pairs = _EDGE_TABLE.get((geom.shape_type, selector))
+        if pairs is None:
+            return MockEdge.pack(self.select_edges(geom, selector))
+
+        bbox = geom.bounds
+        return _box_corners(bbox['min'], bbox['max'])[np.asarray(pairs)].astype(np.float64)
 
     # ========================================================================
     # Spatial Queries (for reference extraction)
@@ -477,7 +590,7 @@ class MockBackend(GeometryBackend):
             # Calculate midpoint
             sx, sy, sz = edge.start
             ex, ey, ez = edge.end
-            return ((sx + ex) / 2, (sy + ey) / 2, (sz + ez) / 2)
+            return ((sx + ex) * 0.5, (sy + ey) * 0.5, (sz + ez) * 0.5)
         else:
             raise ValueError(f"Invalid location '{location}'. Valid: start, end, midpoint")
 
@@ -500,36 +613,72 @@ class MockBackend(GeometryBackend):
         dz = ez - sz
 
         # Normalize
-        length = (dx**2 + dy**2 + dz**2)**0.5
+        length = math.hypot(dx, dy, dz)
         if length < 1e-10:
             raise ValueError("Edge has zero length, cannot compute tangent")
 
-        return (dx / length, dy / length, dz / length)
+        inv_length = 1.0 / length
+        return (dx * inv_length, dy * inv_length, dz * inv_length)
+
+    def get_edge_points(self, edges: List[MockEdge], location: str) -> np.ndarray:
+        """
+        Get the same point ('start', 'end' or 'midpoint') on many mock edges.
+
+        Args:
+            edges: MockEdge objects
+            location: One of 'start', 'end', 'midpoint'
+
+        Returns:
+            (N, 3) array of points
+
+        Raises:
+            ValueError: If location is not valid
+        """
+        points = MockEdge.pack(edges)
+        if location == 'start':
+            return points[:, 0]
+        elif location == 'end':
+            return points[:, 1]
+        elif location == 'midpoint':
+            return (points[:, 0] + points[:, 1]) * 0.5
+        else:
+            raise ValueError(f"Invalid location '{location}'. Valid: start, end, midpoint")
+
+    def get_edge_tangents(self, edges: List[MockEdge]) -> np.ndarray:
+        """
+        Get the tangent vectors of many mock edges at once.
+
+        Returns:
+            (N, 3) array of normalized tangents
+
+        Raises:
+            ValueError: If any edge has zero length
+        """
+        points = MockEdge.pack(edges)
+        directions = points[:, 1] - points[:, 0]
+        lengths = np.sqrt(np.einsum('ij,ij->i', directions, directions))
+        if np.any(lengths < 1e-10):
+            raise ValueError("Edge has zero length, cannot compute tangent")
+
+        return directions / lengths[:, None]
 
     # ========================================================================
     # Export/Tessellation
     # ========================================================================
 
-    def tessellate(self, geom: MockGeometry, tolerance: float = 0.1) -> Tuple[List, List]:
+    def tessellate(self, geom: MockGeometry, tolerance: float = 0.1,
+                   with_normals: bool = False) -> Tuple[np.ndarray, ...]:
         """
         Mock tessellation - return simple triangle mesh.
 
-        For testing, returns a minimal valid mesh (triangulated box).
+        For testing, always returns the same minimal valid mesh (triangulated
+        box) regardless of geometry and tolerance, as the same (N, 3) float32
+        / (M, 3) uint32 arrays CadQueryBackend returns. The arrays are shared
+        read-only module constants.
         """
-        # Simple box mesh for testing
-        vertices = [
-            (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),  # Bottom
-            (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),      # Top
-        ]
-        triangles = [
-            (0, 1, 2), (0, 2, 3),  # Bottom
-            (4, 5, 6), (4, 6, 7),  # Top
-            (0, 1, 5), (0, 5, 4),  # Sides...
-            (1, 2, 6), (1, 6, 5),
-            (2, 3, 7), (2, 7, 6),
-            (3, 0, 4), (3, 4, 7),
-        ]
-        return vertices, triangles
+        if with_normals:
+            return _MOCK_VERTICES, _MOCK_TRIANGLES, face_normals(_MOCK_VERTICES, _MOCK_TRIANGLES)
+        return _MOCK_VERTICES, _MOCK_TRIANGLES
 
     def __repr__(self) -> str:
         return f"MockBackend(operations={self.operations_count})"
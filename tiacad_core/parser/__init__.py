@@ -18,16 +18,48 @@ Test Coverage: 86/86 tests passing (100%)
 
 __version__ = "3.1.1"
 
-# All components implemented!
-from .parameter_resolver import ParameterResolver, ParameterResolutionError
-from .parts_builder import PartsBuilder, PartsBuilderError
-from .operations_builder import OperationsBuilder, OperationsBuilderError
-from .tiacad_parser import (
-    TiaCADParser,
-    TiaCADDocument,
-    TiaCADParserError,
-    parse  # Convenience function
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# All components implemented! Resolved on first access (PEP 562), so
+# importing one parser submodule does not load the whole pipeline.
+_LAZY_IMPORTS = {
+    'ParameterResolver': '.parameter_resolver',
+    'ParameterResolutionError': '.parameter_resolver',
+    'PartsBuilder': '.parts_builder',
+    'PartsBuilderError': '.parts_builder',
+    'OperationsBuilder': '.operations_builder',
+    'OperationsBuilderError': '.operations_builder',
+    'TiaCADParser': '.tiacad_parser',
+    'TiaCADDocument': '.tiacad_parser',
+    'TiaCADParserError': '.tiacad_parser',
+    'parse': '.tiacad_parser',  # Convenience function
+}
+
+if TYPE_CHECKING:
+    from .parameter_resolver import ParameterResolver, ParameterResolutionError
+    from .parts_builder import PartsBuilder, PartsBuilderError
+    from .operations_builder import OperationsBuilder, OperationsBuilderError
+    from .tiacad_parser import (
+        TiaCADParser,
+        TiaCADDocument,
+        TiaCADParserError,
+        parse
+    )
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Parameter resolution
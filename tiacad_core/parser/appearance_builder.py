@@ -5,13 +5,20 @@ Extracts appearance-related parsing logic from PartsBuilder to maintain
 separation of concerns.
 """
 
+import functools
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
-from .color_parser import ColorParser, ColorParseError
+from .color_parser import Color, ColorParser, ColorParseError
 
 logger = logging.getLogger(__name__)
 
+# Part spec keys that carry appearance information
+_APPEARANCE_KEYS = frozenset({'color', 'material', 'appearance'})
+
+# PBR properties copied from an 'appearance' block
+_PBR_PROPS = ('finish', 'metalness', 'roughness', 'opacity')
+
 
 class AppearanceBuilder:
     """
@@ -29,6 +36,12 @@ class AppearanceBuilder:
         """
         self.color_parser = color_parser
 
+        # Models reuse the same color strings across many parts
+        self._parse_color_cached = functools.lru_cache(maxsize=256)(color_parser.parse)
+
+        # Appearance block contents -> (rgba color or None, PBR properties)
+        self._appearance_memo: Dict[frozenset, Tuple[Optional[Tuple], Dict[str, Any]]] = {}
+
     def build_appearance_metadata(
         self,
         spec: Dict[str, Any],
@@ -59,6 +72,9 @@ class AppearanceBuilder:
             >>> builder.build_appearance_metadata({'material': 'aluminum'}, 'plate')
             {'material': 'aluminum', 'color': (0.75, 0.75, 0.75, 1.0), ...}
         """
+        if _APPEARANCE_KEYS.isdisjoint(spec):
+            return {}  # Most parts have no appearance at all
+
         metadata = {}
 
         # Priority 1: Material (base color + properties)
@@ -72,6 +88,12 @@ class AppearanceBuilder:
 
         return metadata
 
+    def _parse_color_value(self, value: Any) -> Color:
+        """Parse a color, reusing results for repeated color strings"""
+        if isinstance(value, str):
+            return self._parse_color_cached(value)
+        return self.color_parser.parse(value)  # Lists/dicts are unhashable
+
     def _parse_color(
         self,
         spec: Dict[str, Any],
@@ -87,7 +109,7 @@ class AppearanceBuilder:
             return
 
         try:
-            color = self.color_parser.parse(spec['color'])
+            color = self._parse_color_value(spec['color'])
             metadata['color'] = color.to_rgba()
             logger.debug(f"Part '{part_name}' color: {color.to_hex()}")
 
@@ -163,26 +185,48 @@ class AppearanceBuilder:
 
         appearance = spec['appearance']
 
-        # Parse color if present
-        if 'color' in appearance:
-            try:
-                color = self.color_parser.parse(appearance['color'])
-                metadata['color'] = color.to_rgba()
-
-            except ColorParseError as e:
-                logger.warning(
-                    f"Failed to parse appearance color for part '{part_name}': {e}"
-                )
-
-        # Copy PBR properties
-        pbr_properties = ['finish', 'metalness', 'roughness', 'opacity']
-        for prop in pbr_properties:
-            if prop in appearance:
-                # Initialize material_properties if needed
-                if 'material_properties' not in metadata:
-                    metadata['material_properties'] = {}
-
-                metadata['material_properties'][prop] = appearance[prop]
+        # Parts sharing an appearance block (YAML anchors, copy-pasted
+        # blocks) reuse one parse. Resolved specs are fresh dicts, so the
+        # memo is keyed on content rather than identity.
+        try:
+            key = frozenset(appearance.items())
+        except (AttributeError, TypeError):
+            key = None  # Unhashable values (e.g. color as a list)
+
+        cached = self._appearance_memo.get(key) if key is not None else None
+        if cached is not None:
+            color, pbr = cached
+        else:
+            color = None
+            color_ok = True
+
+            # Parse color if present
+            if 'color' in appearance:
+                try:
+                    color = self._parse_color_value(appearance['color']).to_rgba()
+
+                except ColorParseError as e:
+                    color_ok = False
+                    logger.warning(
+                        f"Failed to parse appearance color for part '{part_name}': {e}"
+                    )
+
+            # Collect PBR properties
+            pbr = {prop: appearance[prop] for prop in _PBR_PROPS if prop in appearance}
+
+            if key is not None and color_ok:
+                self._appearance_memo[key] = (color, pbr)
+
+        if color is not None:
+            metadata['color'] = color
+
+        if pbr:
+            if 'material_properties' in metadata:
+                # Override the material's own properties
+                metadata['material_properties'].update(pbr)
+            else:
+                # Copy: the memoized dict is shared by every part using this block
+                metadata['material_properties'] = dict(pbr)
 
         if metadata.get('material_properties'):
             logger.debug(
@@ -16,10 +16,17 @@ Design: Progressive disclosure
 - Advanced: full PBR appearance definition
 """
 
-import re
+import difflib
+import math
+import numbers
 from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
 from ..materials_library import get_material_library
-from .color_utils import hsl_to_rgb, rgb_to_hex, clamp
+from .color_utils import (
+    hsl_to_rgb, rgb_to_hex, clamp, hex_digits_to_rgba, hex_to_rgb_batch, is_hex_digits
+)
 
 
 class ColorParseError(Exception):
@@ -34,6 +41,8 @@ class ColorParseError(Exception):
 class Color:
     """Parsed color with RGBA values (0-1 range)"""
 
+    __slots__ = ('r', 'g', 'b', 'a', '_hex', '_key')
+
     def __init__(self, r: float, g: float, b: float, a: float = 1.0):
         """
         Args:
@@ -46,6 +55,20 @@ class Color:
         self.g = clamp(g)
         self.b = clamp(b)
         self.a = clamp(a)
+        self._hex = None  # to_hex() result, computed on first use
+        self._key = None  # 8-bit quantized RGBA for ==/hash, computed on first use
+
+    @classmethod
+    def _unchecked(cls, r: float, g: float, b: float, a: float = 1.0) -> 'Color':
+        """Build a Color from values already known to be in 0-1 (no clamping)"""
+        color = cls.__new__(cls)
+        color.r = r
+        color.g = g
+        color.b = b
+        color.a = a
+        color._hex = None
+        color._key = None
+        return color
 
     def to_rgb(self) -> Tuple[float, float, float]:
         """Return RGB tuple (0-1 range)"""
@@ -57,20 +80,99 @@ class Color:
 
     def to_hex(self) -> str:
         """Return hex string #RRGGBB"""
-        return rgb_to_hex(self.r, self.g, self.b)
+        if self._hex is None:
+            self._hex = rgb_to_hex(self.r, self.g, self.b)
+        return self._hex
 
     def __repr__(self):
         if self.a < 1.0:
             return f"Color(r={self.r:.2f}, g={self.g:.2f}, b={self.b:.2f}, a={self.a:.2f})"
         return f"Color(r={self.r:.2f}, g={self.g:.2f}, b={self.b:.2f})"
 
+    def _quantized(self) -> Tuple[int, int, int, int]:
+        """RGBA rounded to 8-bit ints (colors equal at 8-bit precision compare equal)"""
+        key = self._key
+        if key is None:
+            key = self._key = (int(self.r * 255 + 0.5), int(self.g * 255 + 0.5),
+                               int(self.b * 255 + 0.5), int(self.a * 255 + 0.5))
+        return key
+
     def __eq__(self, other):
         if not isinstance(other, Color):
             return False
-        return (abs(self.r - other.r) < 0.01 and
-                abs(self.g - other.g) < 0.01 and
-                abs(self.b - other.b) < 0.01 and
-                abs(self.a - other.a) < 0.01)
+        return self._quantized() == other._quantized()
+
+    def __hash__(self):
+        return hash(self._quantized())
+
+
+class ColorBuffer:
+    """
+    Many RGBA colors (0-1 range) in one contiguous (N, 4) float32 array.
+
+    Bulk alternative to a list of Color objects: 16 bytes per color and
+    r/g/b/a channel views for array math.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self, n: int):
+        """
+        Args:
+            n: Number of colors (initialized to opaque black)
+        """
+        self.data = np.zeros((n, 4), dtype=np.float32)
+        self.data[:, 3] = 1.0
+
+    @classmethod
+    def from_rgba(cls, rgba: np.ndarray) -> 'ColorBuffer':
+        """Wrap an existing (N, 4) float32 RGBA array without copying"""
+        buffer = cls.__new__(cls)
+        buffer.data = rgba
+        return buffer
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def r(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def g(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def b(self) -> np.ndarray:
+        return self.data[:, 2]
+
+    @property
+    def a(self) -> np.ndarray:
+        return self.data[:, 3]
+
+    def set_from_hex_list(self, hex_strings: List[str]) -> None:
+        """
+        Fill the buffer from hex strings (#RGB, #RRGGBB or #RRGGBBAA).
+
+        Decoded in bulk by hex_to_rgb_batch().
+
+        Raises:
+            ColorParseError: If a string is not a valid hex color, or the
+                number of strings does not match the buffer size
+        """
+        if len(hex_strings) != len(self.data):
+            raise ColorParseError(
+                f"Expected {len(self.data)} hex colors, got {len(hex_strings)}"
+            )
+
+        try:
+            self.data[:] = hex_to_rgb_batch([h.strip() for h in hex_strings])
+        except ValueError as e:
+            raise ColorParseError(f"Invalid hex color list: {e}") from None
+
+    def to_color_list(self) -> List['Color']:
+        """Convert to individual Color objects (for code expecting Colors)"""
+        return [Color._unchecked(r, g, b, a) for r, g, b, a in self.data.tolist()]
 
 
 # Basic named colors (CSS/web colors)
@@ -98,6 +200,18 @@ BASIC_COLORS = {
     'maroon': (0.5, 0.0, 0.0),
 }
 
+# Parsed basic colors, built once. Parsed colors are treated as immutable,
+# so every lookup of a name returns the same instance.
+_BASIC_COLOR_OBJS = {name: Color._unchecked(r, g, b) for name, (r, g, b) in BASIC_COLORS.items()}
+
+# Max entries in each parser's string/array parse cache
+_PARSE_CACHE_SIZE = 1024
+
+# Reciprocals for scaling RGB (0-255) and HSL (0-360, 0-100) to 0-1
+_INV_255 = 1.0 / 255.0
+_INV_360 = 1.0 / 360.0
+_INV_100 = 1.0 / 100.0
+
 
 class ColorParser:
     """
@@ -114,11 +228,59 @@ class ColorParser:
 
     def __init__(self, palette: Optional[Dict[str, Any]] = None):
         """
+        The palette is parsed up front. An invalid or circular entry only
+        raises when its name is looked up, and non-string keys are ignored
+        (they can never match a color name). Changing the palette
+        afterwards requires a new parser.
+
         Args:
             palette: Optional color palette dictionary from 'colors:' section
         """
         self.palette = palette or {}
         self.material_library = get_material_library()
+        self._all_names: Optional[List[str]] = None  # Suggestion candidates
+        # Parsed strings/arrays (lists keyed as tuples). Per parser because
+        # named lookups depend on the palette, which is fixed after init.
+        self._parse_cache: Dict[Any, Color] = {}
+        # Exact type -> parse method; tuples are accepted like lists
+        self._dispatch = {
+            str: self._parse_string,
+            list: self._parse_array,
+            tuple: self._parse_array,
+            dict: self._parse_object,
+        }
+
+        # Parse the palette once; entries may reference each other in any order
+        self._resolved_palette: Dict[str, Color] = {}
+        self._palette_pending = {
+            name.lower(): value for name, value in self.palette.items() if isinstance(name, str)
+        }
+        self._palette_resolving = set()
+        self._palette_errors: Dict[str, ColorParseError] = {}  # Raised on lookup
+        while self._palette_pending:
+            try:
+                self._resolve_palette_entry(next(iter(self._palette_pending)))
+            except ColorParseError:
+                pass  # Recorded in _palette_errors; unused entries are harmless
+
+    def _resolve_palette_entry(self, name: str) -> Color:
+        """Parse one palette entry (and any entries it references)"""
+        if name in self._palette_resolving:
+            raise ColorParseError(f"Circular palette reference: '{name}'", value=name)
+
+        self._palette_resolving.add(name)
+        try:
+            color = self.parse(self._palette_pending[name])
+        except ColorParseError as e:
+            del self._palette_pending[name]
+            self._palette_errors[name] = e
+            raise
+        finally:
+            self._palette_resolving.discard(name)
+
+        del self._palette_pending[name]
+        self._resolved_palette[name] = color
+        return color
 
     def parse(self, value: Any) -> Color:
         """
@@ -136,27 +298,107 @@ class ColorParser:
         if value is None:
             raise ColorParseError("Color value cannot be None")
 
-        if isinstance(value, str):
-            return self._parse_string(value)
-        elif isinstance(value, list):
-            return self._parse_array(value)
-        elif isinstance(value, dict):
-            return self._parse_object(value)
-        else:
-            raise ColorParseError(
-                f"Invalid color format: {type(value).__name__}. "
-                f"Expected string, list, or dict.",
-                value=value
-            )
+        cls = type(value)
+        handler = self._dispatch.get(cls)
+        if handler is None:
+            # Subclasses of the supported types (rare): resolve with isinstance
+            for cls, handler in self._dispatch.items():
+                if isinstance(value, cls):
+                    break
+            else:
+                raise ColorParseError(
+                    f"Invalid color format: {type(value).__name__}. "
+                    f"Expected string, list, tuple, or dict.",
+                    value=value
+                )
+
+        if cls is dict:
+            return handler(value)  # Unhashable; not cached
+
+        # Scenes reuse a handful of colors many times; skip re-parsing them
+        key = value if cls is str else tuple(value)
+        try:
+            color = self._parse_cache.get(key)
+        except TypeError:
+            return handler(value)  # Unhashable array elements
+        if color is not None:
+            return color
+
+        color = handler(value)
+        if len(self._parse_cache) >= _PARSE_CACHE_SIZE:
+            del self._parse_cache[next(iter(self._parse_cache))]  # Evict oldest
+        self._parse_cache[key] = color
+        return color
+
+    def parse_many(self, values: List[Any]) -> ColorBuffer:
+        """
+        Parse many color values into a ColorBuffer.
+
+        RGB/RGBA arrays (the bulk case, e.g. per-vertex colors) are
+        validated together in NumPy and hex strings are decoded together
+        by hex_to_rgb_batch(); every other format goes through parse()
+        one value at a time.
+
+        Args:
+            values: Color values in any supported format
+
+        Returns:
+            ColorBuffer holding one RGBA row per value
+
+        Raises:
+            ColorParseError: If any value is invalid
+        """
+        out = np.empty((len(values), 4), dtype=np.float32)
+        out[:, 3] = 1.0
+
+        # Group numeric arrays by width: {3: (indices, rows), 4: (indices, rows)}
+        groups = {3: ([], []), 4: ([], [])}
+        hex_indices, hex_strings = [], []
+        for i, value in enumerate(values):
+            if isinstance(value, str):
+                value = value.strip()
+                if value[:1] == '#':
+                    hex_indices.append(i)
+                    hex_strings.append(value)
+                    continue
+            group = groups.get(len(value)) if isinstance(value, list) else None
+            if group is None:
+                out[i] = self.parse(value).to_rgba()
+            else:
+                group[0].append(i)
+                group[1].append(value)
+
+        if hex_strings:
+            try:
+                out[hex_indices] = hex_to_rgb_batch(hex_strings)
+            except ValueError as e:
+                # Slow path: let the scalar parser report the bad value
+                for hex_str in hex_strings:
+                    self._parse_hex(hex_str)
+                raise ColorParseError(str(e)) from None
+
+        for width, (indices, rows) in groups.items():
+            if not rows:
+                continue
+            try:
+                arr = np.asarray(rows)
+            except ValueError:
+                arr = None  # Ragged/nested rows
+            if (arr is None or arr.ndim != 2 or arr.dtype.kind not in 'iuf'
+                    or not ((arr >= 0) & (arr <= 1)).all()):
+                # Slow path: the scalar parser applies its own element rules
+                # (e.g. bool dtype rows may hold numpy bools) and reports the
+                # bad value
+                for row in rows:
+                    self._parse_array(row)
+            out[indices, :width] = arr
+
+        return ColorBuffer.from_rgba(out)
 
     def _parse_string(self, s: str) -> Color:
         """Parse string: named color or hex"""
-        s = s.strip()
-
-        if s.startswith('#'):
-            return self._parse_hex(s)
-        else:
-            return self._parse_named(s)
+        s = s.strip()  # The only normalization pass for hex and named colors
+        return self._parse_hex(s) if s[:1] == '#' else self._parse_named(s)
 
     def _parse_hex(self, hex_str: str) -> Color:
         """
@@ -167,50 +409,28 @@ class ColorParser:
             #FF0000 -> red
             #FF000080 -> red, 50% transparent
         """
-        hex_str = hex_str.strip()
-
-        if not hex_str.startswith('#'):
+        if hex_str[:1] != '#':
             raise ColorParseError(f"Hex color must start with #: {hex_str}", value=hex_str)
 
         hex_digits = hex_str[1:]
 
-        # Validate hex characters
-        if not re.match(r'^[0-9A-Fa-f]+$', hex_digits):
-            raise ColorParseError(
-                f"Invalid hex color: {hex_str}. Must contain only 0-9, A-F.",
-                value=hex_str
-            )
-
-        # Parse based on length
-        if len(hex_digits) == 3:
-            # #RGB -> #RRGGBB
-            r = int(hex_digits[0] * 2, 16) / 255
-            g = int(hex_digits[1] * 2, 16) / 255
-            b = int(hex_digits[2] * 2, 16) / 255
-            return Color(r, g, b)
-
-        elif len(hex_digits) == 6:
-            # #RRGGBB
-            r = int(hex_digits[0:2], 16) / 255
-            g = int(hex_digits[2:4], 16) / 255
-            b = int(hex_digits[4:6], 16) / 255
-            return Color(r, g, b)
-
-        elif len(hex_digits) == 8:
-            # #RRGGBBAA
-            r = int(hex_digits[0:2], 16) / 255
-            g = int(hex_digits[2:4], 16) / 255
-            b = int(hex_digits[4:6], 16) / 255
-            a = int(hex_digits[6:8], 16) / 255
-            return Color(r, g, b, a)
-
-        else:
+        try:
+            r, g, b, a = hex_digits_to_rgba(hex_digits)
+        except (KeyError, ValueError):
+            # Slow path: work out what was wrong for the error message
+            if not is_hex_digits(hex_digits):
+                raise ColorParseError(
+                    f"Invalid hex color: {hex_str}. Must contain only 0-9, A-F.",
+                    value=hex_str
+                ) from None
             raise ColorParseError(
                 f"Invalid hex color length: {hex_str}. "
                 f"Expected 3, 6, or 8 hex digits (got {len(hex_digits)}).",
                 value=hex_str,
                 suggestions=["#RGB", "#RRGGBB", "#RRGGBBAA"]
-            )
+            ) from None
+
+        return Color._unchecked(r, g, b, a)  # Table values are all in 0-1
 
     def _parse_named(self, name: str) -> Color:
         """
@@ -221,18 +441,23 @@ class ColorParser:
         2. Basic colors (red, blue, etc.)
         3. Material library (aluminum, steel, etc.)
         """
-        name = name.strip().lower()
+        name = name.lower()
 
         # 1. Check palette first (user-defined colors take precedence)
-        if name in self.palette:
-            # Recursively parse palette value (could be hex, RGB, etc.)
-            palette_value = self.palette[name]
-            return self.parse(palette_value)
+        color = self._resolved_palette.get(name)
+        if color is not None:
+            return color
+        if name in self._palette_pending:
+            # Palette entry referenced while the palette is being parsed
+            return self._resolve_palette_entry(name)
+        error = self._palette_errors.get(name)
+        if error is not None:
+            raise error.with_traceback(None)
 
         # 2. Check basic colors
-        if name in BASIC_COLORS:
-            r, g, b = BASIC_COLORS[name]
-            return Color(r, g, b)
+        color = _BASIC_COLOR_OBJS.get(name)
+        if color is not None:
+            return color
 
         # 3. Check material library
         try:
@@ -311,7 +536,7 @@ class ColorParser:
         self._validate_range(r, g, b, a, value_range=(0, 255))
 
         # Convert to 0-1 range
-        return Color(r / 255, g / 255, b / 255, a / 255)
+        return Color(r * _INV_255, g * _INV_255, b * _INV_255, a * _INV_255)
 
     def _parse_hsl(self, obj: Dict[str, Any]) -> Color:
         """
@@ -327,7 +552,19 @@ class ColorParser:
         lightness = obj['l']
         a = obj.get('a', 1.0)
 
-        # Validate ranges
+        # Validate ranges with a single reduction. max() can skip a NaN,
+        # so NaNs are caught through the sum instead.
+        if (max(-h, h - 360, -s, s - 100, -lightness, lightness - 100, -a, a - 1) > 0
+                or math.isnan(h + s + lightness + a)):
+            self._diagnose_hsl(obj, h, s, lightness, a)
+
+        # Convert HSL to RGB (normalize to 0-1 range)
+        r, g, b = hsl_to_rgb(h * _INV_360, s * _INV_100, lightness * _INV_100)
+        return Color(r, g, b, a)
+
+    def _diagnose_hsl(self, obj: Dict[str, Any], h: float, s: float,
+                      lightness: float, a: float) -> None:
+        """Raise the error for whichever HSL component is out of range"""
         if not (0 <= h <= 360):
             raise ColorParseError(f"HSL hue must be 0-360 degrees: {h}", value=obj)
         if not (0 <= s <= 100):
@@ -337,15 +574,11 @@ class ColorParser:
         if not (0 <= a <= 1):
             raise ColorParseError(f"HSL alpha must be 0-1: {a}", value=obj)
 
-        # Convert HSL to RGB (normalize to 0-1 range)
-        r, g, b = hsl_to_rgb(h / 360, s / 100, lightness / 100)
-        return Color(r, g, b, a)
-
     def _validate_range(self, *values, value_range: Tuple[float, float]):
         """Validate that all values are in range"""
         min_val, max_val = value_range
         for val in values:
-            if not isinstance(val, (int, float)):
+            if not isinstance(val, numbers.Real):
                 raise ColorParseError(
                     f"Color value must be a number: {val} ({type(val).__name__})"
                 )
@@ -354,24 +587,19 @@ class ColorParser:
                     f"Color value {val} out of range ({min_val}-{max_val})"
                 )
 
+    def _all_candidate_names(self) -> List[str]:
+        """All known color names (basic, material, palette), built once"""
+        if self._all_names is None:
+            self._all_names = (
+                list(BASIC_COLORS) + self.material_library.list_all()
+                + [name for name in self.palette if isinstance(name, str)]
+            )
+        return self._all_names
+
     def _find_similar_colors(self, name: str) -> List[str]:
         """Find similar color names for suggestions"""
-        suggestions = []
-
-        # Check basic colors
-        for color_name in BASIC_COLORS.keys():
-            if name in color_name or color_name in name:
-                suggestions.append(color_name)
-
-        # Check material library (limit to 5 suggestions)
-        material_names = self.material_library.list_all()
-        for mat_name in material_names:
-            if name in mat_name or mat_name in name:
-                suggestions.append(mat_name)
-
-        # Check palette
-        for palette_name in self.palette.keys():
-            if name in palette_name or palette_name in name:
-                suggestions.append(f"{palette_name} (from palette)")
-
-        return suggestions[:5]  # Limit to 5 suggestions
+        matches = difflib.get_close_matches(name, self._all_candidate_names(), n=5, cutoff=0.55)
+        return [
+            f"{match} (from palette)" if match in self.palette else match
+            for match in matches
+        ]
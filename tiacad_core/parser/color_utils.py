@@ -5,7 +5,38 @@ These are stateless utility functions for color space conversions
 and manipulations.
 """
 
-from typing import Tuple
+from typing import List, Tuple
+
+import numpy as np
+
+_HEX_CHARS = '0123456789abcdefABCDEF'
+
+# str.translate table deleting every hex digit - anything left over is invalid
+_NON_HEX = str.maketrans('', '', _HEX_CHARS)
+
+# Hex digit pair (any case) -> channel value in 0-1 range, e.g. 'ff' -> 1.0
+_HEX_PAIR_TO_UNIT = {
+    hi + lo: int(hi + lo, 16) / 255
+    for hi in _HEX_CHARS
+    for lo in _HEX_CHARS
+}
+
+# Single hex digit of a #RGB color -> channel value ('f' means 'ff')
+_HEX_NIB_TO_UNIT = {c: int(c * 2, 16) / 255 for c in _HEX_CHARS}
+
+
+def is_hex_digits(s: str) -> bool:
+    """
+    Check that a string is non-empty and contains only hex digits
+
+    Examples:
+        >>> is_hex_digits("FF00aa")
+        True
+
+        >>> is_hex_digits("GG0000")
+        False
+    """
+    return bool(s) and not s.translate(_NON_HEX)
 
 
 def hsl_to_rgb(h: float, s: float, lightness: float) -> Tuple[float, float, float]:
@@ -36,35 +67,96 @@ def hsl_to_rgb(h: float, s: float, lightness: float) -> Tuple[float, float, floa
         # Achromatic (gray) - no saturation
         return (lightness, lightness, lightness)
 
-    def hue_to_rgb(p: float, q: float, t: float) -> float:
-        """Helper to convert hue to RGB component"""
-        # Normalize t to 0-1 range
-        if t < 0:
-            t += 1
-        if t > 1:
-            t -= 1
-
-        # Calculate RGB value based on hue segment
-        if t < 1/6:
-            return p + (q - p) * 6 * t
-        if t < 1/2:
-            return q
-        if t < 2/3:
-            return p + (q - p) * (2/3 - t) * 6
-        return p
-
     # Calculate intermediate values
     q = lightness * (1 + s) if lightness < 0.5 else lightness + s - lightness * s
     p = 2 * lightness - q
+    d = q - p
 
-    # Calculate RGB components with hue offset
-    r = hue_to_rgb(p, q, h + 1/3)
-    g = hue_to_rgb(p, q, h)
-    b = hue_to_rgb(p, q, h - 1/3)
+    # Hue offset per component, wrapped into 0-1. Each component then
+    # takes the segment of the CSS hue ramp its offset falls in.
+    t = (h + 1/3) % 1.0
+    r = p + d * 6 * t if t < 1/6 else q if t < 1/2 else p + d * (2/3 - t) * 6 if t < 2/3 else p
+    t = h % 1.0
+    g = p + d * 6 * t if t < 1/6 else q if t < 1/2 else p + d * (2/3 - t) * 6 if t < 2/3 else p
+    t = (h - 1/3) % 1.0
+    b = p + d * 6 * t if t < 1/6 else q if t < 1/2 else p + d * (2/3 - t) * 6 if t < 2/3 else p
 
     return (r, g, b)
 
 
+def hsl_to_rgb_batch(hsl: np.ndarray) -> np.ndarray:
+    """
+    Convert many HSL colors (0-1 range) to RGB at once
+
+    Vectorized form of hsl_to_rgb() for materializing whole palettes or
+    gradients; gives the same values as calling hsl_to_rgb() per row.
+
+    Args:
+        hsl: (N, 3) array-like of (h, s, lightness) rows
+
+    Returns:
+        (N, 3) float64 array of (r, g, b) rows in 0-1 range
+
+    Examples:
+        >>> hsl_to_rgb_batch([[0, 1, 0.5], [0, 0, 0.5]])
+        array([[1. , 0. , 0. ],
+               [0.5, 0.5, 0.5]])
+    """
+    hsl = np.asarray(hsl, dtype=np.float64).reshape(-1, 3)
+    h = hsl[:, 0:1]
+    s = hsl[:, 1:2]
+    lightness = hsl[:, 2:3]
+
+    q = np.where(lightness < 0.5, lightness * (1 + s), lightness + s - lightness * s)
+    p = 2 * lightness - q
+    d = q - p
+
+    # Hue offsets for (r, g, b), wrapped into 0-1 as in hsl_to_rgb()
+    t = (h + np.array([1/3, 0.0, -1/3])) % 1.0
+    rgb = np.select(
+        [t < 1/6, t < 1/2, t < 2/3],
+        [p + d * 6 * t, np.broadcast_to(q, t.shape), p + d * (2/3 - t) * 6],
+        default=np.broadcast_to(p, t.shape)
+    )
+
+    # Achromatic (gray) rows
+    return np.where(s == 0, lightness, rgb)
+
+
+def hex_digits_to_rgba(digits: str) -> Tuple[float, float, float, float]:
+    """
+    Decode RGB, RRGGBB or RRGGBBAA hex digits (no '#') to an RGBA tuple
+
+    Each channel is a single table lookup, so no separate validation pass
+    is needed: a non-hex digit raises KeyError.
+
+    Args:
+        digits: 3, 6 or 8 hex digits
+
+    Returns:
+        (r, g, b, a) tuple in 0-1 range
+
+    Raises:
+        KeyError: If digits contains a non-hex character
+        ValueError: If digits is not 3, 6 or 8 characters long
+    """
+    n = len(digits)
+    if n == 6:
+        return (_HEX_PAIR_TO_UNIT[digits[0:2]], _HEX_PAIR_TO_UNIT[digits[2:4]],
+                _HEX_PAIR_TO_UNIT[digits[4:6]], 1.0)
+    if n == 8:
+        return (_HEX_PAIR_TO_UNIT[digits[0:2]], _HEX_PAIR_TO_UNIT[digits[2:4]],
+                _HEX_PAIR_TO_UNIT[digits[4:6]], _HEX_PAIR_TO_UNIT[digits[6:8]])
+    if n == 3:
+        # #RGB -> #RRGGBB
+        return (_HEX_NIB_TO_UNIT[digits[0]], _HEX_NIB_TO_UNIT[digits[1]],
+                _HEX_NIB_TO_UNIT[digits[2]], 1.0)
+    raise ValueError(
+        f"Invalid hex length: {n}. "
+        f"Expected 3, 6, or 8 hex digits."
+    )
+
+
 def hex_to_rgb(hex_str: str) -> Tuple[float, float, float, float]:
     """
     Convert hex color string to RGBA tuple
@@ -96,35 +188,60 @@ def hex_to_rgb(hex_str: str) -> Tuple[float, float, float, float]:
     # Remove # if present
     hex_str = hex_str.lstrip('#')
 
-    # Parse based on length
-    if len(hex_str) == 3:
-        # #RGB -> expand to #RRGGBB
-        r = int(hex_str[0] * 2, 16) / 255
-        g = int(hex_str[1] * 2, 16) / 255
-        b = int(hex_str[2] * 2, 16) / 255
-        a = 1.0
-
-    elif len(hex_str) == 6:
-        # #RRGGBB
-        r = int(hex_str[0:2], 16) / 255
-        g = int(hex_str[2:4], 16) / 255
-        b = int(hex_str[4:6], 16) / 255
-        a = 1.0
-
-    elif len(hex_str) == 8:
-        # #RRGGBBAA
-        r = int(hex_str[0:2], 16) / 255
-        g = int(hex_str[2:4], 16) / 255
-        b = int(hex_str[4:6], 16) / 255
-        a = int(hex_str[6:8], 16) / 255
-
-    else:
-        raise ValueError(
-            f"Invalid hex length: {len(hex_str)}. "
-            f"Expected 3, 6, or 8 hex digits."
-        )
-
-    return (r, g, b, a)
+    try:
+        return hex_digits_to_rgba(hex_str)
+    except KeyError:
+        raise ValueError(f"Invalid hex color: {hex_str!r}. Must contain only 0-9, A-F.") from None
+
+
+def hex_to_rgb_batch(hex_strings: List[str]) -> np.ndarray:
+    """
+    Convert many hex color strings to RGBA at once
+
+    Strings are grouped by length and each group is decoded with a single
+    bytes.fromhex() call; gives the same values as hex_to_rgb() per string.
+
+    Args:
+        hex_strings: Hex color strings (#RGB, #RRGGBB or #RRGGBBAA, a single '#' is optional)
+
+    Returns:
+        (N, 4) float32 array of (r, g, b, a) rows in 0-1 range
+
+    Raises:
+        ValueError: If any string is not a valid hex color
+
+    Examples:
+        >>> hex_to_rgb_batch(["#F00", "#0000FF80"])
+        array([[1.        , 0.        , 0.        , 1.        ],
+               [0.        , 0.        , 1.        , 0.5019608 ]], dtype=float32)
+    """
+    out = np.empty((len(hex_strings), 4), dtype=np.float32)
+    out[:, 3] = 1.0
+
+    # {width: (indices, digit strings)} - #RGB is expanded into the 6 group
+    groups = {6: ([], []), 8: ([], [])}
+    for i, hex_str in enumerate(hex_strings):
+        digits = hex_str[1:] if hex_str[:1] == '#' else hex_str  # At most one '#'
+        # bytes.fromhex() skips whitespace, so validate characters up front
+        if not is_hex_digits(digits):
+            raise ValueError(f"Invalid hex color: {hex_str!r}. Must contain only 0-9, A-F.")
+        if len(digits) == 3:
+            digits = digits[0] * 2 + digits[1] * 2 + digits[2] * 2
+        group = groups.get(len(digits))
+        if group is None:
+            raise ValueError(
+                f"Invalid hex length: {len(digits)}. "
+                f"Expected 3, 6, or 8 hex digits."
+            )
+        group[0].append(i)
+        group[1].append(digits)
+
+    for width, (indices, digits) in groups.items():
+        if digits:
+            raw = np.frombuffer(bytes.fromhex(''.join(digits)), dtype=np.uint8)
+            out[indices, :width // 2] = raw.reshape(-1, width // 2) / 255
+
+    return out
 
 
 def rgb_to_hex(r: float, g: float, b: float) -> str:
@@ -146,10 +263,9 @@ def rgb_to_hex(r: float, g: float, b: float) -> str:
         >>> rgb_to_hex(0.5, 0.5, 0.5)
         '#808080'
     """
-    r_int = int(r * 255)
-    g_int = int(g * 255)
-    b_int = int(b * 255)
-    return f"#{r_int:02X}{g_int:02X}{b_int:02X}"
+    # Round to nearest like Color equality does; bytes() rejects
+    # channels outside 0-1 instead of emitting malformed hex
+    return '#' + bytes((int(r * 255 + 0.5), int(g * 255 + 0.5), int(b * 255 + 0.5))).hex().upper()
 
 
 def validate_rgb_range(*values: float) -> None:
@@ -15,7 +15,7 @@ Version: 0.1.0-alpha
 import re
 import logging
 import math
-from typing import Any, Dict, Union, List
+from typing import Any, Dict, Union, List, Optional
 from simpleeval import simple_eval, NameNotDefined, InvalidExpression
 
 from ..utils.exceptions import TiaCADError
@@ -60,6 +60,10 @@ class ParameterResolver:
         self.resolved_cache: Dict[str, Any] = {}
         self.resolution_stack: List[str] = []  # For circular reference detection
 
+        # Single-slot memo for _build_names_dict, keyed on cache size
+        self._names_memo_key: Optional[int] = None
+        self._names_memo: Dict[str, Any] = {}
+
         # Functions available in expressions
         self.functions = {
             'min': min,
@@ -206,9 +210,16 @@ class ParameterResolver:
         Only includes parameters that can be resolved without circular reference.
         Parameters currently being resolved are excluded.
 
+        Outside of nested resolution the result only changes when the cache
+        grows, so the last dict is reused while the cache size is unchanged.
+
         Returns:
             Dict mapping parameter names to their resolved values
         """
+        memoizable = not self.resolution_stack
+        if memoizable and self._names_memo_key == len(self.resolved_cache):
+            return self._names_memo
+
         names = {}
         for param_name in self.raw_parameters:
             # Skip parameters currently being resolved (avoid circular reference)
@@ -229,6 +240,10 @@ class ParameterResolver:
                 # This happens when there are forward references
                 pass
 
+        if memoizable:
+            self._names_memo_key = len(self.resolved_cache)
+            self._names_memo = names
+
         return names
 
     def get_parameter(self, name: str) -> Any:
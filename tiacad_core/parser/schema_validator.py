@@ -17,7 +17,7 @@ Usage:
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 try:
     import jsonschema
@@ -30,6 +30,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Loaded schemas and their compiled validators, keyed by (path, mtime).
+# Shared across SchemaValidator instances so each schema is read and
+# checked once per process.
+_SCHEMA_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+_VALIDATOR_CACHE: Dict[Tuple[str, float], Any] = {}
+
 
 class SchemaValidationError(Exception):
     """Raised when schema validation fails"""
@@ -68,23 +74,44 @@ class SchemaValidator:
             schema_path = Path(__file__).parent.parent.parent / "tiacad-schema.json"
 
         self.schema_path = Path(schema_path)
+        self._cache_key: Optional[Tuple[str, float]] = None
         self.schema = self._load_schema()
 
     def _load_schema(self) -> Optional[Dict[str, Any]]:
-        """Load JSON schema from file"""
+        """Load JSON schema from file (cached while the file is unchanged)"""
         if not self.schema_path.exists():
             logger.warning(f"Schema file not found: {self.schema_path}")
             return None
 
         try:
-            with open(self.schema_path, 'r') as f:
-                schema = json.load(f)
-            logger.debug(f"Loaded schema from {self.schema_path}")
+            cache_key = (str(self.schema_path), self.schema_path.stat().st_mtime)
+            schema = _SCHEMA_CACHE.get(cache_key)
+            if schema is None:
+                with open(self.schema_path, 'r') as f:
+                    schema = json.load(f)
+                _SCHEMA_CACHE[cache_key] = schema
+                logger.debug(f"Loaded schema from {self.schema_path}")
+            self._cache_key = cache_key
             return schema
         except Exception as e:
             logger.error(f"Failed to load schema: {e}")
             return None
 
+    def _get_validator(self):
+        """
+        Return a compiled validator for the loaded schema.
+
+        Raises:
+            SchemaError: If the schema itself is invalid
+        """
+        validator = _VALIDATOR_CACHE.get(self._cache_key)
+        if validator is None:
+            validator_cls = jsonschema.validators.validator_for(self.schema)
+            validator_cls.check_schema(self.schema)
+            validator = validator_cls(self.schema)
+            _VALIDATOR_CACHE[self._cache_key] = validator
+        return validator
+
     def validate(self, data: Dict[str, Any]) -> List[str]:
         """
         Validate YAML data against schema.
@@ -105,7 +132,11 @@ class SchemaValidator:
 
         errors = []
         try:
-            jsonschema.validate(instance=data, schema=self.schema)
+            error = jsonschema.exceptions.best_match(
+                self._get_validator().iter_errors(data)
+            )
+            if error is not None:
+                raise error
             logger.info("Schema validation passed")
         except ValidationError as e:
             error_msg = self._format_validation_error(e)
@@ -163,7 +163,8 @@ class TiaCADDocument:
                 f"Failed to export part '{part_name}' to STEP: {str(e)}"
             ) from e
 
-    def export_3mf(self, output_path: str, part_name: Optional[str] = None):
+    def export_3mf(self, output_path: str, part_name: Optional[str] = None,
+                   source_digest: Optional[str] = None):
         """
         Export parts to 3MF file with multi-material support.
 
@@ -179,6 +180,8 @@ class TiaCADDocument:
         Args:
             output_path: Path to output .3mf file
             part_name: Part to export (if None, exports all parts)
+            source_digest: SHA1 of the source YAML; reuses tessellations
+                           cached by earlier exports of the same file
 
         Raises:
             TiaCADParserError: If export fails
@@ -199,11 +202,13 @@ class TiaCADDocument:
                 temp_registry = PartRegistry()
                 part = self.parts.get(part_name)
                 temp_registry.add(part_name, part.geometry)
-                export_3mf(temp_registry, output_path, self.metadata)
+                export_3mf(temp_registry, output_path, self.metadata,
+                           source_digest=source_digest)
                 logger.info(f"Exported part '{part_name}' to {output_path}")
             else:
                 # Export all parts with materials
-                export_3mf(self.parts, output_path, self.metadata)
+                export_3mf(self.parts, output_path, self.metadata,
+                           source_digest=source_digest)
 
             logger.info(
                 f"Exported {len(self.parts.list_parts())} parts to {output_path} (3MF)"
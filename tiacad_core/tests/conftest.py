@@ -42,14 +42,15 @@ def mock_backend() -> MockBackend:
     Fast mock backend for unit tests.
 
     Use this for tests that don't need real CAD operations.
-    10-100x faster than CadQueryBackend.
+    10-100x faster than CadQueryBackend. Records operation_history so
+    tests can assert on which operations were applied.
 
     Examples:
         def test_something(mock_backend):
             box = mock_backend.create_box(10, 10, 10)
             part = Part("test", box, backend=mock_backend)
     """
-    return MockBackend()
+    return MockBackend(track_history=True)
 
 
 @pytest.fixture
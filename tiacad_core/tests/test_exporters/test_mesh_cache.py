@@ -0,0 +1,74 @@
+"""
+Unit tests for the tessellation cache used by the 3MF exporter and
+`tiacad validate-geometry`.
+"""
+
+import os
+
+import numpy as np
+import cadquery as cq
+
+from tiacad_core.exporters import mesh_cache
+from tiacad_core.utils.cache import code_fingerprint
+
+
+class TestMeshCache:
+    """Test tessellate_cached()"""
+
+    def test_tessellate_arrays(self):
+        """Tessellation should return (N, 3) float32 and (M, 3) uint32 arrays"""
+        shape = cq.Workplane("XY").box(10, 10, 10).val()
+
+        vertices, triangles = mesh_cache.tessellate(shape, 0.1, 0.1)
+
+        assert vertices.dtype == np.float32 and vertices.shape[1] == 3
+        assert triangles.dtype == np.uint32 and triangles.shape[1] == 3
+        assert len(triangles) == 12  # 6 faces x 2 triangles
+        assert triangles.max() < len(vertices)
+
+    def test_no_digest_skips_cache(self, tmp_path, monkeypatch):
+        """Without a source digest nothing should be written"""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        shape = cq.Workplane("XY").box(10, 10, 10).val()
+
+        mesh_cache.tessellate_cached(shape, "box", 0.1, 0.1)
+
+        assert not (tmp_path / 'tiacad').exists()
+
+    def test_cached_mesh_reused(self, tmp_path, monkeypatch):
+        """A second call with the same key should load the stored mesh"""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        shape = cq.Workplane("XY").box(10, 10, 10).val()
+
+        assert not mesh_cache.is_cached("abc123", "box", 0.1, 0.1)
+        first = mesh_cache.tessellate_cached(shape, "box", 0.1, 0.1, source_digest="abc123")
+        assert mesh_cache.is_cached("abc123", "box", 0.1, 0.1)
+
+        # A different shape under the same key proves the cache was hit
+        other = cq.Workplane("XY").sphere(5).val()
+        second = mesh_cache.tessellate_cached(other, "box", 0.1, 0.1, source_digest="abc123")
+
+        np.testing.assert_array_equal(first[0], second[0])
+        np.testing.assert_array_equal(first[1], second[1])
+
+    def test_key_includes_code_fingerprint(self, tmp_path, monkeypatch):
+        """Meshes are stored under the version and source fingerprint"""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+        assert mesh_cache.mesh_cache_dir().name.endswith(code_fingerprint())
+
+    def test_old_meshes_pruned(self, tmp_path, monkeypatch):
+        """Only the most recently used meshes are kept"""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        monkeypatch.setattr(mesh_cache, 'MESH_CACHE_MAX_FILES', 2)
+        shape = cq.Workplane("XY").box(10, 10, 10).val()
+
+        for age, digest in enumerate(("a1", "b2", "c3")):
+            mesh_cache.tessellate_cached(shape, "box", 0.1, 0.1, source_digest=digest)
+            # Distinct mtimes, oldest first, regardless of filesystem resolution
+            entry = mesh_cache._cache_file(digest, "box", 0.1, 0.1)
+            os.utime(entry, (1000 + age, 1000 + age))
+
+        assert not mesh_cache.is_cached("a1", "box", 0.1, 0.1)
+        assert mesh_cache.is_cached("c3", "box", 0.1, 0.1)
+        assert len(list((tmp_path / 'tiacad' / 'mesh').rglob('*.npz'))) == 2
@@ -352,6 +352,24 @@ class TestMeshGeneration:
             else:
                 raise
 
+    def test_deduplicate_vertices(self):
+        """Shared vertices are merged and collapsed triangles dropped"""
+        import numpy as np
+
+        vertices = np.array([
+            [0, 0, 0], [1, 0, 0], [0, 1, 0],
+            [1, 0, 0], [0, 1, 0], [1, 1, 0],
+        ], dtype=np.float32)
+        triangles = np.array([[0, 1, 2], [3, 5, 4], [1, 3, 4]], dtype=np.uint32)
+
+        unique_vertices, remapped = ThreeMFExporter._deduplicate_vertices(vertices, triangles)
+
+        assert len(unique_vertices) == 4
+        assert len(remapped) == 2  # [1, 3, 4] collapses to an edge
+        # Every triangle still references the same positions
+        for old, new in zip(triangles[:2], remapped):
+            assert np.array_equal(vertices[old], unique_vertices[new])
+
     def test_invalid_geometry_raises_error(self):
         """Should raise error for invalid geometry"""
         try:
@@ -7,6 +7,9 @@ the GeometryBackend interface correctly and produce expected results.
 
 import pytest
 import math
+import pickle
+import cadquery as cq
+import numpy as np
 from typing import Tuple
 
 from tiacad_core.geometry import (
@@ -16,7 +19,9 @@ from tiacad_core.geometry import (
     get_default_backend,
     set_default_backend,
     reset_default_backend,
+    suggest_fuzzy,
 )
+from tiacad_core.geometry.mock_backend import MockEdge
 
 
 # ============================================================================
@@ -83,7 +88,7 @@ class TestMockBackend:
 
     @pytest.fixture
     def backend(self):
-        return MockBackend()
+        return MockBackend(track_history=True)
 
     def test_create_box(self, backend):
         """MockBackend creates MockGeometry for box"""
@@ -165,6 +170,74 @@ class TestMockBackend:
         assert 'max' in bbox
         assert 'center' in bbox
 
+    def test_boolean_difference_many(self, backend):
+        """Default multi-tool difference chains single differences"""
+        box = backend.create_box(10, 10, 10)
+        holes = [backend.create_cylinder(1, 20) for _ in range(3)]
+
+        result = backend.boolean_difference_many(box, holes)
+
+        assert result.operation_history == ('difference',) * 3
+
+    def test_history_off_by_default(self):
+        """Without track_history, operations are not recorded"""
+        backend = MockBackend()
+        box = backend.create_box(10, 10, 10)
+
+        result = backend.fillet(backend.translate(box, (1, 2, 3)), 1.0)
+        result = backend.boolean_union(result, box)
+
+        assert result.operation_history == ()
+        assert result.center == (1, 2, 3)
+        assert backend.operations_count == 4
+
+    def test_selected_faces_and_edges_hashable(self, backend):
+        """Selected mock faces/edges are frozen and usable as set members"""
+        box = backend.create_box(10, 10, 10)
+
+        faces = backend.select_faces(box, '>Z') + backend.select_faces(box, '>Z')
+        edges = backend.select_edges(box, '|Z')
+
+        assert len(set(faces)) == 1
+        assert len(set(edges)) == 4
+        with pytest.raises(AttributeError):  # FrozenInstanceError
+            faces[0].center = (0, 0, 0)
+
+    def test_identical_primitives_shared(self, backend):
+        """Identical primitive requests return the same immutable instance"""
+        initial_count = backend.operations_count
+
+        box1 = backend.create_box(10, 20, 30)
+        box2 = backend.create_box(10, 20, 30)
+
+        assert box1 is box2
+        assert backend.create_box(10, 20, 31) is not box1
+        assert backend.operations_count == initial_count + 3
+
+    def test_batch_edge_queries(self, backend):
+        """Batch edge queries match the per-edge versions"""
+        box = backend.create_box(10, 20, 30)
+        edges = backend.select_edges(box, '|Z') + backend.select_edges(box, '|X')
+
+        tangents = backend.get_edge_tangents(edges)
+        midpoints = backend.get_edge_points(edges, 'midpoint')
+
+        assert tangents.shape == (6, 3)
+        for i, edge in enumerate(edges):
+            assert tuple(tangents[i]) == pytest.approx(backend.get_edge_tangent(edge))
+            assert tuple(midpoints[i]) == pytest.approx(backend.get_edge_point(edge, 'midpoint'))
+
+        with pytest.raises(ValueError):
+            backend.get_edge_tangents([MockEdge(start=(1, 1, 1), end=(1, 1, 1))])
+
+    def test_select_edges_batch(self, backend):
+        """Batch edge selection matches packed select_edges()"""
+        box = backend.translate(backend.create_box(10, 20, 30), (1, 2, 3))
+
+        for selector in ('|Z', '|X', '|Y'):
+            expected = MockEdge.pack(backend.select_edges(box, selector))
+            np.testing.assert_array_equal(backend.select_edges_batch(box, selector), expected)
+
     def test_operations_count_tracking(self, backend):
         """Backend tracks operation count"""
         initial_count = backend.operations_count
@@ -184,6 +257,12 @@ class TestMockBackend:
         assert len(vertices) > 0
         assert len(triangles) > 0
 
+        # Same array contract as CadQueryBackend
+        assert vertices.shape[1] == 3 and vertices.dtype == np.float32
+        assert triangles.shape[1] == 3 and triangles.dtype == np.uint32
+        _, _, normals = backend.tessellate(box, with_normals=True)
+        assert normals.shape == (len(triangles), 3)
+
 
 # ============================================================================
 # CadQueryBackend Specific Tests
@@ -226,6 +305,40 @@ class TestCadQueryBackend:
         center = backend.get_center(sphere)
         assert_point_close(center, (0, 0, 0))
 
+    def test_repeated_primitives_share_topology(self, backend):
+        """Identical primitives reuse one canonical shape"""
+        first = backend.create_cylinder(1.5, 10)
+        second = backend.create_cylinder(1.5, 10)
+        other = backend.create_cylinder(2, 10)
+
+        assert first.val().isSame(second.val())
+        assert not first.val().isSame(other.val())
+
+        # Moving one instance leaves the other where it was
+        moved = backend.translate(first, (10, 0, 0))
+        assert_point_close(backend.get_center(moved), (10, 0, 0))
+        assert_point_close(backend.get_center(second), (0, 0, 0))
+
+        # Each instance has its own handle: moving one in place doesn't
+        # move the other instances or the cached primitive
+        assert first.val().wrapped is not second.val().wrapped
+        first.val().move(cq.Location(cq.Vector(100, 0, 0)))
+        assert_point_close(backend.get_center(first), (100, 0, 0))
+        assert_point_close(backend.get_center(second), (0, 0, 0))
+        assert_point_close(backend.get_center(backend.create_cylinder(1.5, 10)), (0, 0, 0))
+
+    def test_create_cone(self, backend):
+        """CadQueryBackend creates exact, vertically centered cones"""
+        frustum = backend.create_cone(10, 5, 30)
+        pointed = backend.create_cone(10, 0, 30)
+
+        assert frustum.val().Volume() == pytest.approx(math.pi * 30 / 3 * (100 + 50 + 25))
+        assert pointed.val().Volume() == pytest.approx(math.pi * 30 / 3 * 100)
+
+        bbox = backend.get_bounding_box(pointed)
+        assert bbox['min'][2] == pytest.approx(-15, abs=1e-3)
+        assert bbox['max'][2] == pytest.approx(15, abs=1e-3)
+
     def test_boolean_union(self, backend):
         """Union combines geometries"""
         box = backend.create_box(10, 10, 10)
@@ -244,6 +357,176 @@ class TestCadQueryBackend:
         center = backend.get_center(moved)
         assert_point_close(center, (5, 10, 15))
 
+    def test_boolean_difference_many(self, backend):
+        """Multi-tool difference matches chained single differences"""
+        plate = backend.create_box(40, 5, 40)
+        holes = [
+            backend.translate(backend.create_cylinder(2, 10), (x, 0, 0))
+            for x in (-10, 0, 10)
+        ]
+
+        batched = backend.boolean_difference_many(plate, holes)
+
+        chained = plate
+        for hole in holes:
+            chained = backend.boolean_difference(chained, hole)
+
+        assert batched.val().Volume() == pytest.approx(chained.val().Volume())
+        assert batched.val().Volume() < plate.val().Volume()
+
+    def test_boolean_difference_many_skips_disjoint_tools(self, backend):
+        """Tools outside the base's bounding box are not cut at all"""
+        plate = backend.create_box(40, 5, 40)
+        far_away = backend.translate(backend.create_cylinder(2, 10), (100, 0, 0))
+
+        assert backend.boolean_difference_many(plate, [far_away]) is plate
+
+    def test_boolean_difference_many_multi_object_tool(self, backend):
+        """Each shape of a multi-object tool is checked for overlap on its own"""
+        plate = backend.create_box(40, 5, 40)
+        far_away = backend.translate(backend.create_cylinder(2, 10), (100, 0, 0))
+        overlapping = backend.create_cylinder(2, 10)
+        tool = far_away.newObject([far_away.val(), overlapping.val()])
+
+        batched = backend.boolean_difference_many(plate, [tool])
+        chained = backend.boolean_difference(plate, tool)
+
+        assert batched.val().Volume() == pytest.approx(chained.val().Volume())
+        assert batched.val().Volume() < plate.val().Volume()
+
+    def test_scale(self, backend):
+        """Uniform scale multiplies extents about the origin"""
+        box = backend.translate(backend.create_box(10, 10, 10), (10, 0, 0))
+
+        scaled = backend.scale(box, 2.0)
+
+        bbox = backend.get_bounding_box(scaled)
+        assert_point_close(bbox['min'], (10, -10, -10))
+        assert_point_close(bbox['max'], (30, 10, 10))
+        assert scaled.val().Volume() == pytest.approx(8000)
+
+    def test_get_edge_tangents(self, backend):
+        """Batch tangents match the per-edge tangents"""
+        box = backend.create_box(10, 20, 30)
+        edges = backend.select_edges(box, "|Z") + backend.select_edges(box, "|X")
+
+        tangents = backend.get_edge_tangents(edges)
+
+        assert tangents.shape == (len(edges), 3)
+        for edge, tangent in zip(edges, tangents):
+            assert_point_close(tuple(tangent), backend.get_edge_tangent(edge), tolerance=1e-9)
+
+    def test_batch_face_and_edge_queries(self, backend):
+        """Batch face/edge queries match the per-item queries"""
+        box = backend.create_box(10, 20, 30)
+        faces = backend.select_faces(box, "#Z")
+        edges = backend.select_edges(box, "|Z")
+
+        centers = backend.get_face_centers(faces)
+        normals = backend.get_face_normals(faces)
+        assert centers.shape == normals.shape == (len(faces), 3)
+        for face, center, normal in zip(faces, centers, normals):
+            assert_point_close(tuple(center), backend.get_face_center(face))
+            assert_point_close(tuple(normal), backend.get_face_normal(face))
+
+        for location in ('start', 'end', 'midpoint'):
+            points = backend.get_edge_points(edges, location)
+            for edge, point in zip(edges, points):
+                assert_point_close(tuple(point), backend.get_edge_point(edge, location))
+
+        with pytest.raises(ValueError):
+            backend.get_edge_points(edges, 'middle')
+
+    def test_selection_cached(self, backend):
+        """Repeated selections on the same shape reuse the first result"""
+        box = backend.create_box(10, 10, 10)
+
+        first = backend.select_faces(box, ">Z")
+        second = backend.select_faces(box, ">Z")
+
+        assert len(first) == 1
+        assert first == second
+        assert first is not second  # callers get their own list
+        assert len(backend.select_edges(box, "|Z")) == 4
+        assert len(backend._selection_cache) == 1
+
+    def test_selection_cache_respects_orientation(self, backend):
+        """A reversed shape does not reuse the original shape's selections"""
+        box = backend.create_box(10, 10, 10)
+        reversed_box = box.newObject([box.val().__class__(box.val().wrapped.Reversed())])
+
+        backend.select_faces(box, "+Z")
+        cached = backend.select_faces(reversed_box, "+Z")
+        fresh = CadQueryBackend().select_faces(reversed_box, "+Z")
+
+        assert_point_close(backend.get_face_center(cached[0]),
+                           backend.get_face_center(fresh[0]))
+
+    def test_bounding_box_upper_contains_exact(self, backend):
+        """The cheap bbox is never smaller than the exact one"""
+        sphere = backend.translate(backend.create_sphere(10), (5, 0, 0))
+
+        exact = backend.get_bounding_box(sphere)
+        upper = backend.get_bounding_box_upper(sphere)
+
+        for axis in range(3):
+            assert upper['min'][axis] <= exact['min'][axis] + 1e-6
+            assert upper['max'][axis] >= exact['max'][axis] - 1e-6
+
+    def test_face_normal_cached(self, backend):
+        """Face normals are computed once per face object"""
+        box = backend.create_box(10, 10, 10)
+        top = backend.select_faces(box, ">Z")[0]
+
+        assert_point_close(backend.get_face_normal(top), (0, 0, 1))
+        assert_point_close(backend.get_face_normal(top), (0, 0, 1))
+        assert len(backend._normal_cache) == 1
+
+        # The reversed face is the "same" shape but has the opposite normal
+        flipped = top.__class__(top.wrapped.Reversed())
+        assert_point_close(backend.get_face_normal(flipped), (0, 0, -1))
+
+    def test_fuzzy_boolean(self, backend):
+        """Booleans accept a fuzzy tolerance sized from the model"""
+        box = backend.create_box(10, 10, 10)
+        cylinder = backend.create_cylinder(2, 20)
+
+        fuzzy = suggest_fuzzy(backend.get_bounding_box(box))
+        assert fuzzy == pytest.approx(1e-5)
+
+        exact = backend.boolean_difference(box, cylinder)
+        fuzzed = backend.boolean_difference(box, cylinder, fuzzy=fuzzy)
+        assert fuzzed.val().Volume() == pytest.approx(exact.val().Volume(), rel=1e-6)
+
+    def test_bounding_box_cached(self, backend):
+        """Repeated bbox queries reuse the extents computed for the shape"""
+        box = backend.create_box(10, 20, 30)
+
+        bbox = backend.get_bounding_box(box)
+        assert_point_close(bbox['min'], (-5, -15, -10))
+        assert_point_close(bbox['max'], (5, 15, 10))
+        assert_point_close(bbox['center'], (0, 0, 0))
+        assert len(backend._bbox_cache) == 1
+
+        backend.get_center(box)
+        assert len(backend._bbox_cache) == 1
+
+        # A transformed result is a new shape with its own entry
+        moved = backend.translate(box, (5, 0, 0))
+        assert_point_close(backend.get_center(moved), (5, 0, 0))
+        assert len(backend._bbox_cache) == 2
+
+    def test_pickle_drops_caches(self, backend):
+        """Backends pickle (for the CLI parse cache) with empty caches"""
+        box = backend.create_box(10, 20, 30)
+        backend.get_bounding_box(box)
+        backend.get_face_normal(backend.select_faces(box, ">Z")[0])
+
+        restored = pickle.loads(pickle.dumps(backend))
+
+        assert len(restored._bbox_cache) == len(restored._normal_cache) == 0
+        assert_point_close(restored.get_bounding_box(box)['max'], (5, 15, 10))
+
     def test_tessellate(self, backend):
         """Tessellation returns vertices and triangles"""
         box = backend.create_box(10, 10, 10)
@@ -257,6 +540,23 @@ class TestCadQueryBackend:
         # Tessellation may have more for curved approximations
         assert len(vertices) >= 8
 
+        assert vertices.shape[1] == 3 and vertices.dtype == np.float32
+        assert triangles.shape[1] == 3 and triangles.dtype == np.uint32
+        assert triangles.max() < len(vertices)
+
+    def test_tessellate_with_normals(self, backend):
+        """Face normals are unit length and point out of a box"""
+        box = backend.create_box(10, 10, 10)
+
+        vertices, triangles, normals = backend.tessellate(box, with_normals=True)
+
+        assert normals.shape == (len(triangles), 3)
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0)
+
+        # Outward: normal points away from the box center for every face
+        centroids = vertices[triangles].mean(axis=1)
+        assert np.all(np.einsum('ij,ij->i', normals, centroids) > 0)
+
 
 # ============================================================================
 # Backend Comparison Tests
@@ -356,6 +656,16 @@ class TestMockGeometry:
         # New instance updated
         assert moved.center == (5, 10, 15)
 
+    def test_with_center_shifts_bounds_lazily(self):
+        """with_center defers the bounds shift until bounds are read"""
+        geom = MockGeometry(shape_type='box', parameters={'width': 10, 'height': 10, 'depth': 10})
+        moved = geom.with_center((5, 0, 0)).with_center((5, 0, 2))
+
+        assert moved._bounds_cache is None
+        assert moved.bounds['min'] == (0, -5, -3)
+        assert moved.bounds['max'] == (10, 5, 7)
+        assert moved.bounds['center'] == (5, 0, 2)
+
     def test_add_operation(self):
         """add_operation records operation in history"""
         geom = MockGeometry(shape_type='box', parameters={})
@@ -363,3 +673,16 @@ class TestMockGeometry:
 
         assert 'test_op' in modified.operation_history
         assert len(geom.operation_history) == 0  # Original unchanged
+
+    def test_immutable_and_hashable(self):
+        """MockGeometry is frozen, so it can be hashed and its bounds cached"""
+        geom = MockGeometry(shape_type='box', parameters={'width': 10})
+
+        with pytest.raises(AttributeError):  # FrozenInstanceError
+            geom.center = (1, 2, 3)
+        with pytest.raises(TypeError):
+            geom.parameters['width'] = 20
+
+        assert geom.bounds is geom.bounds
+        assert hash(geom) == hash(MockGeometry(shape_type='box', parameters={'width': 10}))
+        assert isinstance(geom.add_operation('op').operation_history, tuple)
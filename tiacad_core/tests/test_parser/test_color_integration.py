@@ -258,6 +258,53 @@ parts:
         assert props['roughness'] == 0.1
         assert props['opacity'] == 0.8
 
+    def test_shared_appearance_anchor(self):
+        """Parts sharing an appearance block (YAML anchor) get the same values"""
+        yaml_content = """
+schema_version: "2.0"
+parts:
+  first:
+    primitive: box
+    parameters:
+      width: 10
+      height: 10
+      depth: 10
+    appearance: &shiny
+      color: "#ff0000"
+      finish: glossy
+      roughness: 0.1
+  second:
+    primitive: box
+    parameters:
+      width: 5
+      height: 5
+      depth: 5
+    appearance: *shiny
+  third:
+    primitive: box
+    parameters:
+      width: 5
+      height: 5
+      depth: 5
+    material: aluminum
+    appearance: *shiny
+"""
+        doc = TiaCADParser.parse_string(yaml_content)
+        first = doc.get_part('first')
+        second = doc.get_part('second')
+        third = doc.get_part('third')
+
+        assert first.metadata['color'] == second.metadata['color'] == (1.0, 0.0, 0.0, 1.0)
+        assert first.metadata['material_properties'] == {'finish': 'glossy', 'roughness': 0.1}
+        assert second.metadata['material_properties'] == first.metadata['material_properties']
+        assert second.metadata['material_properties'] is not first.metadata['material_properties']
+
+        # Appearance overrides the material's properties without leaking into other parts
+        assert third.metadata['color'] == (1.0, 0.0, 0.0, 1.0)
+        assert third.metadata['material_properties']['finish'] == 'glossy'
+        assert 'metalness' in third.metadata['material_properties']
+        assert 'metalness' not in first.metadata['material_properties']
+
     def test_multiple_parts_different_colors(self):
         """Test multiple parts with different color formats"""
         yaml_content = """
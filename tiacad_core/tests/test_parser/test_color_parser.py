@@ -2,8 +2,12 @@
 Tests for ColorParser - all supported color formats
 """
 
+import numpy as np
 import pytest
-from tiacad_core.parser.color_parser import ColorParser, Color, ColorParseError
+from tiacad_core.parser.color_parser import (
+    ColorParser, Color, ColorBuffer, ColorParseError, _PARSE_CACHE_SIZE
+)
+from tiacad_core.parser.color_utils import hsl_to_rgb, hsl_to_rgb_batch, hex_to_rgb, hex_to_rgb_batch
 
 
 class TestColorBasics:
@@ -29,6 +33,26 @@ class TestColorBasics:
         assert c.g == 0.0
         assert c.b == 0.5
 
+    def test_color_slots(self):
+        """Colors use slots, including those built without clamping"""
+        assert not hasattr(Color(1.0, 0.0, 0.0), '__dict__')
+
+        c = ColorParser().parse('#FF8000')
+        assert not hasattr(c, '__dict__')
+        assert c.to_rgba() == (1.0, 128 / 255, 0.0, 1.0)
+
+    def test_equality_and_hash(self):
+        """Colors equal at 8-bit precision compare equal and hash alike"""
+        parser = ColorParser()
+
+        assert parser.parse('#0066CC') == Color(0.0, 0.4, 0.8)
+        assert Color(0.5, 0.5, 0.5) == Color(0.501, 0.5, 0.5)
+        assert Color(0.5, 0.5, 0.5) != Color(0.51, 0.5, 0.5)
+        assert Color(1.0, 0.0, 0.0) != Color(1.0, 0.0, 0.0, 0.5)
+
+        colors = {parser.parse('red'), parser.parse('#FF0000'), parser.parse([1.0, 0.0, 0.0])}
+        assert colors == {Color(1.0, 0.0, 0.0)}
+
     def test_to_rgb(self):
         """Convert to RGB tuple"""
         c = Color(0.5, 0.6, 0.7, 0.8)
@@ -46,6 +70,11 @@ class TestColorBasics:
 
         c = Color(0.0, 0.0, 1.0)
         assert c.to_hex() == "#0000FF"
+        assert c.to_hex() is c.to_hex()  # Computed once
+
+        # Channels round to the nearest 8-bit value
+        assert Color(0.5, 0.999, 0.0).to_hex() == "#80FF00"
+        assert ColorParser().parse("#0066CC").to_hex() == "#0066CC"
 
     def test_color_equality(self):
         """Test color equality"""
@@ -84,6 +113,13 @@ class TestNamedColors:
         red3 = parser.parse("Red")
         assert red1 == red2 == red3
 
+    def test_basic_colors_shared(self):
+        """Basic colors are parsed once and shared between lookups"""
+        parser = ColorParser()
+
+        assert parser.parse('red') is parser.parse('RED')
+        assert parser.parse('red') is ColorParser().parse('red')
+
     def test_material_colors(self):
         """Parse material library colors"""
         parser = ColorParser()
@@ -139,6 +175,12 @@ class TestPalette:
         assert color.b > 0.9  # Should be blue
         assert color.r < 0.1
 
+    def test_palette_entries_parsed_once(self):
+        """Repeated palette lookups return the same parsed color"""
+        parser = ColorParser(palette={'primary': '#0066CC'})
+
+        assert parser.parse('primary') is parser.parse('primary')
+
     def test_nested_palette_reference(self):
         """Palette can reference other palette entries"""
         palette = {
@@ -151,6 +193,27 @@ class TestPalette:
         derived = parser.parse('derived')
         assert base == derived
 
+    def test_palette_resolved_at_init(self):
+        """Palette is parsed up front, in any order; bad entries fail on use"""
+        parser = ColorParser(palette={'derived': 'base', 'base': '#00FF00'})
+        assert parser.parse('derived') is parser.parse('base')
+
+        # An invalid entry only fails when it (or an entry using it) is looked up
+        parser = ColorParser(palette={'good': '#00FF00', 'bad': '#GGHHII', 'alias': 'bad'})
+        assert parser.parse('good') == Color(0.0, 1.0, 0.0)
+        for name in ('bad', 'alias', 'bad'):
+            with pytest.raises(ColorParseError, match="Invalid hex"):
+                parser.parse(name)
+
+        # Cycles also fail only on lookup; non-string keys are ignored
+        parser = ColorParser(palette={'a': 'b', 'b': 'a', 'c': 'red', 1: 'blue'})
+        assert parser.parse('c') == Color(1.0, 0.0, 0.0)
+        for name in ('a', 'b'):
+            with pytest.raises(ColorParseError, match="Circular"):
+                parser.parse(name)
+        with pytest.raises(ColorParseError):
+            parser.parse('1')
+
 
 class TestHexColors:
     """Test hex color parsing"""
@@ -200,6 +263,17 @@ class TestHexColors:
         c3 = parser.parse("#Ff0000")
         assert c1 == c2 == c3
 
+    def test_hex_batch_matches_scalar(self):
+        """hex_to_rgb_batch gives the same values as hex_to_rgb per string"""
+        strings = ["#0066CC", "#F00", "#FF000080", "abc", "#12345678"]
+
+        expected = np.array([hex_to_rgb(h) for h in strings], dtype=np.float32)
+        np.testing.assert_array_equal(hex_to_rgb_batch(strings), expected)
+
+        for bad in (["#FF0000", "#FF 00 00"], ["#FF"]):
+            with pytest.raises(ValueError):
+                hex_to_rgb_batch(bad)
+
     def test_hex_invalid(self):
         """Invalid hex should raise error"""
         parser = ColorParser()
@@ -247,6 +321,16 @@ class TestRGBArrays:
 
         assert "length" in str(exc.value).lower()
 
+    def test_rgb_tuple_and_subclasses(self):
+        """Tuples parse like lists; subclasses of supported types are accepted"""
+        parser = ColorParser()
+
+        class ColorName(str):
+            pass
+
+        assert parser.parse((1.0, 0.0, 0.0, 0.5)) == Color(1.0, 0.0, 0.0, 0.5)
+        assert parser.parse(ColorName("blue")) == Color(0.0, 0.0, 1.0)
+
     def test_rgb_array_out_of_range(self):
         """Values must be in 0-1 range"""
         parser = ColorParser()
@@ -258,6 +342,87 @@ class TestRGBArrays:
             parser.parse([-0.5, 0.0, 0.0])
 
 
+class TestParseCache:
+    """Test caching of repeated parse() inputs"""
+
+    def test_repeated_values_cached(self):
+        """Repeated strings and arrays return the same Color; dicts are not cached"""
+        parser = ColorParser()
+
+        assert parser.parse("#333333") is parser.parse("#333333")
+        assert parser.parse("aluminum") is parser.parse("aluminum")
+        assert parser.parse([0.2, 0.4, 0.6]) is parser.parse([0.2, 0.4, 0.6])
+        assert parser.parse({'r': 255, 'g': 0, 'b': 0}) is not parser.parse({'r': 255, 'g': 0, 'b': 0})
+
+    def test_cache_size_capped(self):
+        """The cache evicts old entries instead of growing without bound"""
+        parser = ColorParser()
+
+        for i in range(_PARSE_CACHE_SIZE + 10):
+            parser.parse(f"#{i:06X}")
+
+        assert len(parser._parse_cache) == _PARSE_CACHE_SIZE
+        assert parser.parse("#000000") == Color(0.0, 0.0, 0.0)
+
+
+class TestParseMany:
+    """Test bulk parsing into RGBA arrays"""
+
+    def test_parse_many_mixed_formats(self):
+        """Arrays are batched, other formats parsed individually, order kept"""
+        parser = ColorParser()
+
+        result = parser.parse_many(['red', [0.0, 0.5, 1.0], [1.0, 1.0, 1.0, 0.5], '#00FF00'])
+
+        assert len(result) == 4
+        np.testing.assert_allclose(result.data, [
+            [1.0, 0.0, 0.0, 1.0],
+            [0.0, 0.5, 1.0, 1.0],
+            [1.0, 1.0, 1.0, 0.5],
+            [0.0, 1.0, 0.0, 1.0],
+        ])
+
+    def test_color_buffer_hex_and_channels(self):
+        """ColorBuffer decodes hex lists and exposes channel views"""
+        buffer = ColorBuffer(3)
+        buffer.set_from_hex_list(['#F00', '#00FF00', '#0000FF80'])
+
+        np.testing.assert_allclose(buffer.r, [1.0, 0.0, 0.0])
+        np.testing.assert_allclose(buffer.a, [1.0, 1.0, 128 / 255])
+
+        colors = buffer.to_color_list()
+        assert colors[1] == Color(0.0, 1.0, 0.0)
+        assert colors[2].a == pytest.approx(128 / 255)
+
+        with pytest.raises(ColorParseError):
+            buffer.set_from_hex_list(['#F00', '#GG0000', '#000'])
+
+    def test_parse_many_invalid(self):
+        """Invalid values in a batch raise the same errors as parse()"""
+        parser = ColorParser()
+
+        with pytest.raises(ColorParseError, match="out of range"):
+            parser.parse_many([[0.0, 0.0, 0.0], [0.5, 1.5, 0.0]])
+
+        with pytest.raises(ColorParseError, match="must be a number"):
+            parser.parse_many([[0.0, 'x', 0.0]])
+
+        # Scalar and batch paths accept the same element types
+        row = [np.int64(1), 0, np.float32(0.5)]
+        assert parser.parse(row) == Color(1.0, 0.0, 0.5)
+        np.testing.assert_allclose(parser.parse_many([row]).data, [[1.0, 0.0, 0.5, 1.0]])
+        with pytest.raises(ColorParseError, match="must be a number"):
+            parser.parse([np.bool_(True), 0, 0])
+        with pytest.raises(ColorParseError, match="must be a number"):
+            parser.parse_many([[np.bool_(True), np.bool_(False), np.bool_(False)]])
+
+        # Hex strings follow parse()'s rules: exactly one leading '#'
+        with pytest.raises(ColorParseError):
+            parser.parse('##FF0000')
+        with pytest.raises(ColorParseError, match="Invalid hex"):
+            parser.parse_many(['#00FF00', '##FF0000'])
+
+
 class TestRGBObjects:
     """Test RGB object parsing {r, g, b}"""
 
@@ -334,6 +499,16 @@ class TestHSLColors:
         color = parser.parse({'h': 0, 's': 100, 'l': 50, 'a': 0.5})
         assert color.a == 0.5
 
+    def test_hsl_batch_matches_scalar(self):
+        """hsl_to_rgb_batch gives the same values as hsl_to_rgb per row"""
+        rows = [(h / 360, s / 100, lightness / 100)
+                for h in range(0, 361, 15)
+                for s in (0, 40, 100)
+                for lightness in (0, 30, 50, 80, 100)]
+
+        expected = np.array([hsl_to_rgb(*row) for row in rows])
+        np.testing.assert_array_equal(hsl_to_rgb_batch(rows), expected)
+
     def test_hsl_out_of_range(self):
         """HSL values must be in valid ranges"""
         parser = ColorParser()
@@ -350,6 +525,12 @@ class TestHSLColors:
         with pytest.raises(ColorParseError):
             parser.parse({'h': 0, 's': 100, 'l': 101})
 
+        # The error names the component that failed; NaN is rejected too
+        with pytest.raises(ColorParseError, match="alpha"):
+            parser.parse({'h': 0, 's': 100, 'l': 50, 'a': 1.5})
+        with pytest.raises(ColorParseError, match="saturation"):
+            parser.parse({'h': 0, 's': float('nan'), 'l': 50})
+
 
 class TestErrorHandling:
     """Test error handling and messages"""
@@ -391,6 +572,18 @@ class TestErrorHandling:
         assert exc.value.suggestions
         assert "red" in exc.value.suggestions
 
+    def test_suggestions_catch_misspellings(self):
+        """Suggestions should include close misspellings and palette names"""
+        parser = ColorParser(palette={"brand-blue": "#0066CC"})
+
+        with pytest.raises(ColorParseError) as exc:
+            parser.parse("bleu")
+        assert "blue" in exc.value.suggestions
+
+        with pytest.raises(ColorParseError) as exc:
+            parser.parse("brand-bleu")
+        assert "brand-blue (from palette)" in exc.value.suggestions
+
 
 class TestRealWorldExamples:
     """Test realistic usage patterns"""
@@ -195,6 +195,16 @@ class TestNestedReferences:
         assert result1 == result2 == 200
         assert 'expensive' in resolver.resolved_cache
 
+    def test_names_dict_reused_until_cache_grows(self):
+        """Test that expression names are rebuilt only when new parameters resolve"""
+        resolver = ParameterResolver({'a': 1, 'b': '${a + 1}'})
+        resolver.resolve_all()
+
+        names = resolver._build_names_dict()
+        assert names == {'a': 1, 'b': 2}
+        assert resolver._build_names_dict() is names
+        assert resolver.resolve('${a + b}') == 3
+
 
 class TestStringSubstitution:
     """Test string substitution and mixed content"""
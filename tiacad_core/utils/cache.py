@@ -0,0 +1,50 @@
+"""
+On-disk cache helpers shared by the CLI parse cache and the mesh cache
+
+Cache layout:
+    ~/.cache/tiacad/parse/...   pickled TiaCADDocuments (cli.py)
+    ~/.cache/tiacad/mesh/...    tessellated parts (exporters/mesh_cache.py)
+"""
+
+import functools
+import hashlib
+import os
+from pathlib import Path
+
+
+def cache_root() -> Path:
+    """Root directory for TiaCAD caches (respects XDG_CACHE_HOME)"""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'tiacad'
+
+
+@functools.lru_cache(maxsize=None)
+def code_fingerprint() -> str:
+    """
+    Fingerprint of the tiacad_core sources (path, size, mtime of each .py).
+
+    Part of every cache key, so editing parser/geometry code in a dev
+    checkout invalidates cached results without a version bump.
+    """
+    package_dir = Path(__file__).parent.parent
+    h = hashlib.sha1()
+    for path in sorted(package_dir.rglob('*.py')):
+        st = path.stat()
+        h.update(f"{path.relative_to(package_dir)}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()[:12]
+
+
+def prune_cache(cache_dir: Path, pattern: str, max_files: int) -> None:
+    """
+    Delete all but the max_files most recently used entries under cache_dir.
+
+    Entries are files matching pattern (searched recursively); directories
+    left empty are removed too.
+    """
+    entries = sorted(cache_dir.rglob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[max_files:]:
+        stale.unlink(missing_ok=True)
+        parent = stale.parent
+        while parent != cache_dir and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent